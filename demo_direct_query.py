@@ -5,12 +5,12 @@ Demo script showing the new direct query functionality
 
 import sys
 import os
-from pathlib import Path
 
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from app.rag_pipeline import RAGPipeline
+from vector_store.vector_store import FAISSStore
 
 def demo_direct_query():
     """Demonstrate the direct query functionality"""
@@ -18,7 +18,7 @@ def demo_direct_query():
     print("=" * 50)
     
     # Check if vector store exists
-    vector_store_exists = Path("test_store/index.faiss").exists() and Path("test_store/docstore.pkl").exists()
+    vector_store_exists = FAISSStore.exists("test_store")
     
     if not vector_store_exists:
         print("❌ No vector store found. Please run the indexing demo first.")
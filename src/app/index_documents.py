@@ -1,11 +1,12 @@
 import sys
 from pathlib import Path
+import numpy as np
 
 # Add project root to sys.path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.ingestion.document_processor import process_document
-from src.retrieval.embeddings import embed_text
+from src.retrieval.embeddings import embed_texts, INDEXING_EMBED_WORKERS
 from src.vector_store.vector_store import FAISSStore
 
 def index_documents(doc_paths, store_dir="test_store"):
@@ -14,14 +15,15 @@ def index_documents(doc_paths, store_dir="test_store"):
     for doc_path in doc_paths:
         print(f"Processing {doc_path} ...")
         chunks = process_document(str(doc_path))
-        embeddings = [embed_text(chunk) for chunk in chunks]
+        if not chunks:
+            continue
         all_chunks.extend(chunks)
-        all_embeddings.extend(embeddings)
+        all_embeddings.append(embed_texts(chunks, max_workers=INDEXING_EMBED_WORKERS))
     print(f"Total chunks: {len(all_chunks)}")
 
     # Initialize FAISSStore with correct dimension for MiniLM (384)
     store = FAISSStore(dimension=384)
-    doc_ids = store.add_texts(all_chunks, all_embeddings)
+    doc_ids = store.add_texts(all_chunks, np.vstack(all_embeddings) if all_embeddings else [])
     print(f"Indexed {len(doc_ids)} chunks.")
 
     # Save the store
@@ -10,7 +10,9 @@ from app.ui_components import (
     show_indexing_format_guidelines,
     show_quick_question_templates,
     display_quality_metrics,
+    quality_emoji_for,
     display_response_preview,
+    display_requirements_list,
     show_vector_store_status
 )
 from app.processing_utils import (
@@ -22,9 +24,9 @@ from app.processing_utils import (
     check_vector_store_exists,
     get_vector_store_info,
     process_requirements_batch,
-    generate_download_files
+    generate_download_files,
+    get_rag_pipeline
 )
-from app.rag_pipeline import RAGPipeline
 
 
 def index_rfp_responses():
@@ -194,7 +196,7 @@ def direct_query_interface():
                         st.markdown("### 🤖 Response")
                     with col2:
                         quality_score = result.get("quality_score", 0)
-                        quality_emoji = "🌟" if quality_score >= 80 else "✅" if quality_score >= 60 else "⚠️" if quality_score >= 40 else "❌"
+                        quality_emoji = quality_emoji_for(quality_score)
                         st.metric("Quality", f"{quality_emoji} {quality_score:.0f}/100")
                     with col3:
                         st.metric("Context", f"{len(result.get('context', '').split(chr(10)+chr(10)))} chunks")
@@ -269,9 +271,7 @@ def show_requirements_and_generate():
         show_requirements_editor()
     else:
         # Just display requirements
-        for i, req in enumerate(st.session_state.requirements, 1):
-            with st.expander(f"Requirement {i}", expanded=False):
-                st.write(req)
+        display_requirements_list(st.session_state.requirements)
     
     # Check Vector Store Status and Generate Responses
     if check_vector_store_exists():
@@ -311,8 +311,8 @@ def show_vector_store_info_section():
         if st.button("🔍 Inspect Vector Store", key="inspect_store"):
             try:
                 from vector_store.vector_store import FAISSStore
-                store = FAISSStore.load("test_store")
-                st.write(f"Vector store contains {len(store.texts)} documents")
+                store = FAISSStore.load("test_store", mmap=True)
+                st.write(f"Vector store contains {len(store.document_map)} documents")
             except Exception as e:
                 st.error(f"Error inspecting vector store: {e}")
 
@@ -357,8 +357,8 @@ def show_batch_processing_interface(top_k, ollama_model, num_requirements):
     st.info(f"Will process requirements {start_from} to {start_from + actual_batch_size - 1}")
     
     if st.button(f"🚀 Generate Responses (Batch: {start_from}-{start_from + actual_batch_size - 1})", type="primary", key="generate_batch"):
-        # Initialize RAG pipeline
-        rag = RAGPipeline(model=ollama_model)
+        # Reuse the cached RAG pipeline
+        rag = get_rag_pipeline(ollama_model)
         
         # Process only the selected batch
         selected_requirements = st.session_state.requirements[start_from-1:start_from-1+actual_batch_size]
@@ -368,8 +368,8 @@ def show_batch_processing_interface(top_k, ollama_model, num_requirements):
 def show_generate_all_interface(top_k, ollama_model):
     """Show generate all responses interface"""
     if st.button("🚀 Generate All Responses", type="primary", key="generate_responses"):
-        # Initialize RAG pipeline
-        rag = RAGPipeline(model=ollama_model)
+        # Reuse the cached RAG pipeline
+        rag = get_rag_pipeline(ollama_model)
         
         # Process all requirements
         results = process_requirements_batch(st.session_state.requirements, rag, top_k, ollama_model, 1)
@@ -1,8 +1,12 @@
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Union
 from pathlib import Path
 import io
 from datetime import datetime
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment
+from openpyxl.utils import get_column_letter
 
 class OutputGenerator:
     """Generate output files in various formats for RAG pipeline results"""
@@ -11,12 +15,21 @@ class OutputGenerator:
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
     
-    def generate_excel(self, results: List[Dict], filename: str = None) -> str:
-        """Generate Excel file with requirements and responses"""
+    def generate_excel(self, results: List[Dict], filename: str = None, streaming: bool = False) -> str:
+        """Generate Excel file with requirements and responses
+        
+        With streaming=True rows are written one at a time to a write-only workbook,
+        so memory stays flat for large result sets.
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"rfp_responses_{timestamp}.xlsx"
         
+        if streaming:
+            output_path = self.output_dir / filename
+            self._write_results_workbook(output_path, results)
+            return str(output_path)
+        
         # Prepare data for DataFrame
         data = []
         for i, result in enumerate(results, 1):
@@ -88,148 +101,142 @@ class OutputGenerator:
         
         return str(output_path)
     
-    def generate_excel_bytes(self, results: List[Dict]) -> bytes:
-        """Generate Excel file as bytes for Streamlit download"""
-        # Prepare data for DataFrame
+    @staticmethod
+    def results_to_dataframe(results: List[Dict]) -> pd.DataFrame:
+        """Build the export table (ID, Requirement, Response, Status and optional quality columns) once"""
+        include_quality = any(result.get("quality_score") is not None for result in results)
+        
+        columns = ["ID", "Requirement", "Response", "Status"]
+        if include_quality:
+            columns += ["Quality Score", "Quality Status", "Completeness", "Clarity",
+                        "Professionalism", "Relevance", "Quality Feedback"]
+        
         data = []
         for i, result in enumerate(results, 1):
-            row_data = {
-                "ID": i,
-                "Requirement": result["requirement"],
-                "Response": result["response"],
-                "Status": result.get("status", "success")
-            }
+            row = [i, result["requirement"], result["response"], result.get("status", "success")]
             
             # Add quality scores if available
-            if result.get("quality_score") is not None:
-                row_data.update({
-                    "Quality Score": result["quality_score"],
-                    "Quality Status": result.get("quality_status", "Unknown"),
-                    "Completeness": result.get("quality_breakdown", {}).get("completeness", ""),
-                    "Clarity": result.get("quality_breakdown", {}).get("clarity", ""),
-                    "Professionalism": result.get("quality_breakdown", {}).get("professionalism", ""),
-                    "Relevance": result.get("quality_breakdown", {}).get("relevance", ""),
-                    "Quality Feedback": "; ".join(result.get("quality_feedback", []))
-                })
-            
-            data.append(row_data)
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
+            if include_quality:
+                if result.get("quality_score") is not None:
+                    breakdown = result.get("quality_breakdown", {})
+                    row += [
+                        result["quality_score"],
+                        result.get("quality_status", "Unknown"),
+                        breakdown.get("completeness", ""),
+                        breakdown.get("clarity", ""),
+                        breakdown.get("professionalism", ""),
+                        breakdown.get("relevance", ""),
+                        "; ".join(result.get("quality_feedback", []))
+                    ]
+                else:
+                    row += [None] * 7
+            
+            data.append(row)
+        
+        return pd.DataFrame(data, columns=columns)
+    
+    def generate_excel_bytes(self, results: Union[List[Dict], pd.DataFrame]) -> bytes:
+        """Generate Excel file as bytes for Streamlit download
         
-        # Create Excel file in memory
+        Accepts the raw results or a DataFrame from results_to_dataframe.
+        """
         output = io.BytesIO()
+        self._write_results_workbook(output, results)
+        return output.getvalue()
+    
+    def _write_results_workbook(self, target, results: Union[List[Dict], pd.DataFrame]):
+        """Stream the results table into a write-only workbook at a path or file object"""
+        df = results if isinstance(results, pd.DataFrame) else self.results_to_dataframe(results)
+        header = list(df.columns)
         
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='RFP Responses', index=False)
-            
-            # Get the workbook and worksheet objects
-            workbook = writer.book
-            worksheet = writer.sheets['RFP Responses']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # Set reasonable column widths
-                if column_letter == 'A':  # ID column
-                    adjusted_width = 5
-                elif column_letter == 'B':  # Requirement column
-                    adjusted_width = min(max_length + 2, 80)
-                elif column_letter == 'C':  # Response column
-                    adjusted_width = min(max_length + 2, 100)
-                else:  # Status column
-                    adjusted_width = min(max_length + 2, 15)
-                
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Enable text wrapping for requirement and response columns
-            from openpyxl.styles import Alignment
-            wrap_alignment = Alignment(wrap_text=True, vertical='top')
-            
-            for row in worksheet.iter_rows(min_row=2):  # Skip header row
-                row[1].alignment = wrap_alignment  # Requirement column
-                row[2].alignment = wrap_alignment  # Response column
+        def rows():
+            for row in df.itertuples(index=False, name=None):
+                yield [self._cell_value(value) for value in row]
         
-        output.seek(0)
-        return output.getvalue()
+        # Set reasonable column widths: ID, Requirement, Response, then status/score columns
+        max_lengths = self._max_lengths(header, rows())
+        column_widths = [5, min(max_lengths[1] + 2, 80), min(max_lengths[2] + 2, 100)]
+        column_widths += [min(length + 2, 15) for length in max_lengths[3:]]
+        
+        self._write_streaming_workbook(target, header, rows(), column_widths, wrap_columns={1, 2})
+    
+    def generate_csv_bytes(self, results: Union[List[Dict], pd.DataFrame]) -> bytes:
+        """Generate CSV file as bytes for Streamlit download
+        
+        Accepts the raw results or a DataFrame from results_to_dataframe.
+        """
+        df = results if isinstance(results, pd.DataFrame) else self.results_to_dataframe(results)
+        return df.to_csv(index=False).encode("utf-8")
 
     def generate_structured_excel_bytes(self, results: List[Dict], original_df: pd.DataFrame, 
                                        requirement_column: str) -> bytes:
         """Generate Excel file preserving original structure with added response column"""
-        # Create a copy of the original dataframe
-        output_df = original_df.copy()
-        
-        # Create a mapping of requirements to responses
+        # Create mappings of requirements to responses and statuses
         response_map = {result["requirement"]: result["response"] for result in results}
-        
-        # Add response column
-        responses = []
-        for _, row in output_df.iterrows():
-            requirement = str(row[requirement_column]).strip()
-            response = response_map.get(requirement, "No response generated")
-            responses.append(response)
-        
-        output_df['Response'] = responses
-        
-        # Add status column
-        statuses = []
-        for _, row in output_df.iterrows():
-            requirement = str(row[requirement_column]).strip()
-            status = next((result["status"] for result in results 
-                          if result["requirement"] == requirement), "unknown")
-            statuses.append(status)
-        
-        output_df['Status'] = statuses
-        
-        # Create Excel file in memory
+        status_map = {}
+        for result in results:
+            status_map.setdefault(result["requirement"], result["status"])
+        
+        header = [*original_df.columns, "Response", "Status"]
+        requirement_idx = list(original_df.columns).index(requirement_column)
+        
+        def rows():
+            # Merge each source row with its response without materializing a copy of the DataFrame
+            for row in original_df.itertuples(index=False, name=None):
+                requirement = str(row[requirement_idx]).strip()
+                yield [
+                    *(self._cell_value(value) for value in row),
+                    response_map.get(requirement, "No response generated"),
+                    status_map.get(requirement, "unknown")
+                ]
+        
+        # Set reasonable column widths: first few columns narrow, the rest wide
+        max_lengths = self._max_lengths(header, rows())
+        column_widths = [min(length + 2, 30) if i < 3 else min(length + 2, 100)
+                         for i, length in enumerate(max_lengths)]
+        
+        # Enable text wrapping for response column
         output = io.BytesIO()
-        
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            output_df.to_excel(writer, sheet_name='RFP Responses', index=False)
-            
-            # Get the workbook and worksheet objects
-            workbook = writer.book
-            worksheet = writer.sheets['RFP Responses']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # Set reasonable column widths
-                if column_letter in ['A', 'B', 'C']:  # First few columns
-                    adjusted_width = min(max_length + 2, 30)
-                else:  # Response and status columns
-                    adjusted_width = min(max_length + 2, 100)
-                
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Enable text wrapping for response column
-            from openpyxl.styles import Alignment
-            wrap_alignment = Alignment(wrap_text=True, vertical='top')
-            
-            # Find response column (should be second to last)
-            response_col_idx = len(output_df.columns) - 1  # -1 for Response, -2 would be Status
-            
-            for row in worksheet.iter_rows(min_row=2):  # Skip header row
-                if len(row) > response_col_idx:
-                    row[response_col_idx - 1].alignment = wrap_alignment  # Response column
-        
-        output.seek(0)
-        return output.getvalue()
\ No newline at end of file
+        self._write_streaming_workbook(output, header, rows(), column_widths,
+                                       wrap_columns={len(header) - 2})
+        return output.getvalue()
+
+    @staticmethod
+    def _cell_value(value):
+        """Convert pandas missing values to empty cells"""
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return None
+        return value
+
+    @staticmethod
+    def _max_lengths(header: List[str], rows) -> List[int]:
+        """Longest string representation per column, header included"""
+        max_lengths = [len(str(name)) for name in header]
+        for row in rows:
+            for i, value in enumerate(row):
+                if value is not None and len(str(value)) > max_lengths[i]:
+                    max_lengths[i] = len(str(value))
+        return max_lengths
+
+    @staticmethod
+    def _write_streaming_workbook(target, header: List[str], rows, column_widths: List[float],
+                                  wrap_columns=frozenset()):
+        """Write rows to an openpyxl write-only workbook, one row at a time"""
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('RFP Responses')
+        
+        # Column widths must be set before the first row is streamed
+        for col_idx, width in enumerate(column_widths, 1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+        
+        worksheet.append(header)
+        
+        wrap_alignment = Alignment(wrap_text=True, vertical='top')
+        for row in rows:
+            for i in wrap_columns:
+                cell = WriteOnlyCell(worksheet, value=row[i])
+                cell.alignment = wrap_alignment
+                row[i] = cell
+            worksheet.append(row)
+        
+        workbook.save(target)
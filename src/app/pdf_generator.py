@@ -7,7 +7,64 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from typing import List, Dict
 from pathlib import Path
 from datetime import datetime
-import io
+from functools import lru_cache
+import tempfile
+
+# In-memory size limit before generate_pdf_bytes spills the rendered PDF to disk
+PDF_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _build_styles():
+    """Build the sample style sheet and custom paragraph styles once per process
+    
+    Styles are only read while rendering, so every PDFGenerator shares them.
+    """
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    )
+    
+    # Requirement style
+    requirement_style = ParagraphStyle(
+        'RequirementStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=12,
+        spaceBefore=6,
+        leftIndent=20,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Response style
+    response_style = ParagraphStyle(
+        'ResponseStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=20,
+        leftIndent=30,
+        rightIndent=20
+    )
+    
+    # Header style
+    header_style = ParagraphStyle(
+        'HeaderStyle',
+        parent=styles['Heading2'],
+        fontSize=12,
+        spaceAfter=15,
+        spaceBefore=20,
+        textColor=colors.darkblue
+    )
+    
+    return styles, title_style, requirement_style, response_style, header_style
+
 
 class PDFGenerator:
     """Generate PDF reports for RAG pipeline results"""
@@ -15,51 +72,8 @@ class PDFGenerator:
     def __init__(self):
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        # Title style
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=16,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        # Requirement style
-        self.requirement_style = ParagraphStyle(
-            'RequirementStyle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=12,
-            spaceBefore=6,
-            leftIndent=20,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Response style
-        self.response_style = ParagraphStyle(
-            'ResponseStyle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=20,
-            leftIndent=30,
-            rightIndent=20
-        )
-        
-        # Header style
-        self.header_style = ParagraphStyle(
-            'HeaderStyle',
-            parent=self.styles['Heading2'],
-            fontSize=12,
-            spaceAfter=15,
-            spaceBefore=20,
-            textColor=colors.darkblue
-        )
+        (self.styles, self.title_style, self.requirement_style,
+         self.response_style, self.header_style) = _build_styles()
     
     def generate_pdf(self, results: List[Dict], filename: str = None, title: str = "RFP Response Document") -> str:
         """Generate PDF file with requirements and responses"""
@@ -68,77 +82,23 @@ class PDFGenerator:
             filename = f"rfp_responses_{timestamp}.pdf"
         
         output_path = self.output_dir / filename
-        
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=A4,
-            rightMargin=inch,
-            leftMargin=inch,
-            topMargin=inch,
-            bottomMargin=inch
-        )
-        
-        # Build content
-        story = []
-        
-        # Add title
-        story.append(Paragraph(title, self.title_style))
-        story.append(Spacer(1, 20))
-        
-        # Add generation date
-        date_str = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-        story.append(Paragraph(f"Generated on: {date_str}", self.styles['Normal']))
-        story.append(Spacer(1, 20))
-        
-        # Add summary
-        total_reqs = len(results)
-        successful_reqs = sum(1 for r in results if r.get("status", "success") == "success")
-        
-        summary_text = f"Total Requirements: {total_reqs}<br/>Successfully Processed: {successful_reqs}"
-        story.append(Paragraph(summary_text, self.styles['Normal']))
-        story.append(Spacer(1, 30))
-        
-        # Add requirements and responses
-        for i, result in enumerate(results, 1):
-            # Requirement header
-            req_header = f"Requirement {i}"
-            story.append(Paragraph(req_header, self.header_style))
-            
-            # Requirement text
-            req_text = result["requirement"].replace('\n', '<br/>')
-            story.append(Paragraph(req_text, self.requirement_style))
-            
-            # Response header
-            story.append(Paragraph("Response:", self.styles['Heading3']))
-            
-            # Response text
-            response_text = result["response"].replace('\n', '<br/>')
-            story.append(Paragraph(response_text, self.response_style))
-            
-            # Add status if not successful
-            if result.get("status") != "success":
-                status_text = f"<b>Status:</b> {result.get('status', 'unknown')}"
-                story.append(Paragraph(status_text, self.styles['Normal']))
-            
-            # Add separator line except for last item
-            if i < len(results):
-                story.append(Spacer(1, 10))
-                story.append(Paragraph("_" * 80, self.styles['Normal']))
-                story.append(Spacer(1, 10))
-        
-        # Build PDF
-        doc.build(story)
+        self.write_pdf(results, str(output_path), title)
         
         return str(output_path)
     
     def generate_pdf_bytes(self, results: List[Dict], title: str = "RFP Response Document") -> bytes:
         """Generate PDF file as bytes for Streamlit download"""
-        # Create PDF document in memory
-        buffer = io.BytesIO()
-        
+        # Build into a spooled file: small documents stay in memory, large ones spill to disk
+        # instead of growing an in-memory buffer alongside the rendered pages
+        with tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE) as output:
+            self.write_pdf(results, output, title)
+            output.seek(0)
+            return output.read()
+    
+    def write_pdf(self, results: List[Dict], output, title: str = "RFP Response Document"):
+        """Render the requirements and responses PDF into a file path or writable file-like object"""
         doc = SimpleDocTemplate(
-            buffer,
+            output,
             pagesize=A4,
             rightMargin=inch,
             leftMargin=inch,
@@ -196,10 +156,6 @@ class PDFGenerator:
         
         # Build PDF
         doc.build(story)
-        
-        # Get the value and reset buffer position
-        buffer.seek(0)
-        return buffer.getvalue()
     
     def generate_summary_table_pdf(self, results: List[Dict], filename: str = None) -> str:
         """Generate a table-style PDF with requirements and responses"""
@@ -4,41 +4,53 @@ Processing utilities for RFP generation and indexing
 import streamlit as st
 import tempfile
 import os
+import time
 from datetime import datetime
-from pathlib import Path
 
 from ingestion.requirement_extractor import RequirementExtractor, extract_requirements_from_file
 from ingestion.rfp_response_indexer import RFPResponseIndexer
 from app.rag_pipeline import RAGPipeline
+from app.ui_components import is_vector_store_ready, vector_store_mtime
+
+
+@st.cache_resource(show_spinner=False)
+def get_rag_pipeline(model, store_dir="test_store"):
+    """Shared RAG pipeline per (model, store_dir), kept across reruns and sessions"""
+    return RAGPipeline(model=model, store_dir=store_dir)
 
 
 def process_requirements_batch(requirements, rag, top_k, ollama_model, start_index=1):
     """Process a batch of requirements and update session state"""
-    from app.ui_components import display_progress_tracking
+    from app.ui_components import (
+        display_progress_tracking, add_display_fields, format_duration,
+        get_responses_frame, mark_responses_changed
+    )
     
     batch_results = []
-    start_time = datetime.now()
+    start_time = time.monotonic()
     
-    # Create progress tracking containers
-    progress_container = st.container()
+    # Create progress tracking containers; the placeholder is redrawn in place
+    progress_container = st.empty()
     status_text = st.empty()
     
     try:
+        # Retrieval for the next requirement overlaps with LLM generation for the current one
+        answers = rag.iter_answers(requirements, top_k)
         for i, requirement in enumerate(requirements):
             # Update current processing status
             actual_index = start_index + i
             status_text.text(f"Processing: {requirement[:80]}...")
             
-            with progress_container:
-                display_progress_tracking(
-                    current=i + 1,
-                    total=len(requirements),
-                    current_item=requirement,
-                    start_time=start_time
-                )
+            display_progress_tracking(
+                current=i + 1,
+                total=len(requirements),
+                current_item=requirement,
+                start_time=start_time,
+                placeholder=progress_container
+            )
             
             # Process requirement
-            result = rag.ask(requirement, top_k)
+            result = next(answers)
             batch_results.append({
                 "requirement": requirement,
                 "response": result["answer"],
@@ -49,6 +61,9 @@ def process_requirements_batch(requirements, rag, top_k, ollama_model, start_ind
                 "quality_feedback": result.get("quality_feedback", [])
             })
         
+        # Preview header fields are computed once here rather than on every rerun
+        add_display_fields(batch_results)
+        
         # Update session state
         if start_index == 1:
             st.session_state.responses = batch_results
@@ -56,14 +71,18 @@ def process_requirements_batch(requirements, rag, top_k, ollama_model, start_ind
             if 'responses' not in st.session_state:
                 st.session_state.responses = []
             st.session_state.responses.extend(batch_results)
+        mark_responses_changed()
+        
+        # Tabular copy of the responses for the sidebar quality summary
+        get_responses_frame()
         
         # Clear progress displays and show completion
         progress_container.empty()
         status_text.empty()
         
         # Display final results
-        completion_time = datetime.now() - start_time
-        st.success(f"🎉 Generated responses for {len(batch_results)} requirements in {str(completion_time).split('.')[0]}!")
+        completion_time = time.monotonic() - start_time
+        st.success(f"🎉 Generated responses for {len(batch_results)} requirements in {format_duration(completion_time)}!")
         
         return batch_results
         
@@ -164,6 +183,9 @@ def perform_indexing():
         indexing_result = indexer.index_rfp_responses(st.session_state.temp_file_path)
         
         if indexing_result['success']:
+            # Cached pipelines hold the old index; drop them so the next query reloads it
+            get_rag_pipeline.clear()
+            vector_store_mtime.clear()
             st.success("🎉 Successfully indexed RFP responses!")
             
             # Show results
@@ -211,8 +233,8 @@ def cleanup_indexing_session():
 def process_direct_query(query, top_k, ollama_model):
     """Process a direct query to the vector store"""
     try:
-        # Initialize RAG pipeline
-        rag = RAGPipeline(model=ollama_model)
+        # Reuse the cached RAG pipeline
+        rag = get_rag_pipeline(ollama_model)
         
         # Get response
         result = rag.ask(query.strip(), top_k)
@@ -241,7 +263,7 @@ def process_direct_query(query, top_k, ollama_model):
 
 def check_vector_store_exists():
     """Check if vector store exists and is ready"""
-    return Path("test_store/index.faiss").exists() and Path("test_store/docstore.pkl").exists()
+    return is_vector_store_ready()
 
 
 def get_vector_store_info():
@@ -11,7 +11,22 @@ This module evaluates the quality of generated RFP responses across multiple dim
 import re
 import numpy as np
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+
+# Common words ignored by the relevance keyword overlap, built once at import
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should'
+})
+
+# Fixed scoring patterns, compiled once at import instead of on every scored response
+_ANSWER_INDICATOR_RE = re.compile(r'\b(yes|no|we will|we can|we provide|our approach|we have)\b')
+_LIST_ITEM_RE = re.compile(r'^\s*[-•\d+]\s', re.MULTILINE)
+_FIRST_PERSON_RE = re.compile(r'\b(I|we)\b')
+_PASSIVE_RE = re.compile(r'\b(is|are|was|were)\s+\w+ed\b')
+_WORD_RE = re.compile(r'\b\w+\b')
 
 
 @dataclass
@@ -57,6 +72,11 @@ class RFPQualityScorer:
                 r'\b(thing|stuff|whatever)\b',  # Vague terms
             ]
         }
+        # Compiled once per scorer; the pattern strings above stay the editable source
+        self._clarity_regexes = {
+            kind: [re.compile(pattern) for pattern in patterns]
+            for kind, patterns in self.clarity_patterns.items()
+        }
     
     def score_response(self, requirement: str, response: str) -> QualityScore:
         """
@@ -80,10 +100,13 @@ class RFPQualityScorer:
                 status="Poor"
             )
         
+        # Word count is shared by several scorers, so split the response only once
+        word_count = len(response.split())
+        
         # Calculate individual scores
-        completeness = self._score_completeness(requirement, response)
+        completeness = self._score_completeness(requirement, response, word_count)
         clarity = self._score_clarity(response)
-        professionalism = self._score_professionalism(response)
+        professionalism = self._score_professionalism(response, word_count)
         relevance = self._score_relevance(requirement, response)
         
         # Calculate weighted overall score
@@ -96,7 +119,7 @@ class RFPQualityScorer:
         
         # Generate feedback
         feedback = self._generate_feedback(
-            completeness, clarity, professionalism, relevance, response
+            completeness, clarity, professionalism, relevance, word_count
         )
         
         # Determine status
@@ -112,7 +135,7 @@ class RFPQualityScorer:
             status=status
         )
     
-    def _score_completeness(self, requirement: str, response: str) -> float:
+    def _score_completeness(self, requirement: str, response: str, word_count: int) -> float:
         """Score how completely the response addresses the requirement"""
         if len(response.strip()) < 50:
             return 30.0  # Too short to be complete
@@ -122,7 +145,7 @@ class RFPQualityScorer:
         
         # Length appropriateness (responses should be substantial)
         req_words = len(requirement.split())
-        resp_words = len(response.split())
+        resp_words = word_count
         
         if resp_words >= req_words * 0.5:  # At least half as long as requirement
             score += 15.0
@@ -131,13 +154,10 @@ class RFPQualityScorer:
             score += 10.0
         
         # Check for question addressing
-        req_questions = len(re.findall(r'\?', requirement))
+        req_questions = requirement.count('?')
         if req_questions > 0:
             # Look for answers or acknowledgment of questions
-            answer_indicators = len(re.findall(
-                r'\b(yes|no|we will|we can|we provide|our approach|we have)\b', 
-                response.lower()
-            ))
+            answer_indicators = len(_ANSWER_INDICATOR_RE.findall(response.lower()))
             if answer_indicators >= req_questions:
                 score += 15.0
         else:
@@ -148,15 +168,16 @@ class RFPQualityScorer:
     def _score_clarity(self, response: str) -> float:
         """Score the clarity and structure of the response"""
         score = 70.0  # Base score
+        lowered = response.lower()
         
         # Check for good structure indicators
-        for pattern in self.clarity_patterns['good']:
-            matches = len(re.findall(pattern, response.lower()))
+        for pattern in self._clarity_regexes['good']:
+            matches = len(pattern.findall(lowered))
             score += min(matches * 5, 15)  # Up to 15 points for good patterns
         
         # Penalize poor clarity indicators
-        for pattern in self.clarity_patterns['poor']:
-            matches = len(re.findall(pattern, response.lower()))
+        for pattern in self._clarity_regexes['poor']:
+            matches = len(pattern.findall(lowered))
             score -= matches * 10
         
         # Check sentence structure
@@ -169,32 +190,32 @@ class RFPQualityScorer:
             score -= 15
         
         # Check for bullet points or numbering (good structure)
-        if re.search(r'^\s*[-•\d+]\s', response, re.MULTILINE):
+        if _LIST_ITEM_RE.search(response):
             score += 10
         
         return max(min(score, 100.0), 0.0)
     
-    def _score_professionalism(self, response: str) -> float:
+    def _score_professionalism(self, response: str, word_count: int) -> float:
         """Score the professional language and tone"""
         score = 70.0  # Base score
+        # Lowercase once and test every phrase against the same buffer
+        lowered = response.lower()
         
         # Positive professional language
-        for phrase in self.professional_phrases['positive']:
-            if phrase in response.lower():
-                score += 3  # Up to significant bonus for professional terms
+        positive_hits = sum(phrase in lowered for phrase in self.professional_phrases['positive'])
+        score += 3 * positive_hits  # Up to significant bonus for professional terms
         
         # Negative unprofessional language
-        for phrase in self.professional_phrases['negative']:
-            if phrase in response.lower():
-                score -= 10
+        negative_hits = sum(phrase in lowered for phrase in self.professional_phrases['negative'])
+        score -= 10 * negative_hits
         
         # Check for proper business writing
-        if re.search(r'\b(I|we)\b', response):  # Uses first person appropriately
+        if _FIRST_PERSON_RE.search(response):  # Uses first person appropriately
             score += 5
         
         # Check for passive voice overuse (should be balanced)
-        passive_indicators = len(re.findall(r'\b(is|are|was|were)\s+\w+ed\b', response))
-        total_words = len(response.split())
+        passive_indicators = len(_PASSIVE_RE.findall(response))
+        total_words = word_count
         if total_words > 0:
             passive_ratio = passive_indicators / total_words
             if passive_ratio > 0.3:  # Too much passive voice
@@ -209,13 +230,12 @@ class RFPQualityScorer:
     def _score_relevance(self, requirement: str, response: str) -> float:
         """Score how relevant the response is to the requirement"""
         # Simple keyword overlap scoring
-        req_words = set(re.findall(r'\b\w+\b', requirement.lower()))
-        resp_words = set(re.findall(r'\b\w+\b', response.lower()))
+        req_words = set(_WORD_RE.findall(requirement.lower()))
+        resp_words = set(_WORD_RE.findall(response.lower()))
         
         # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'}
-        req_words = req_words - stop_words
-        resp_words = resp_words - stop_words
+        req_words = req_words - STOP_WORDS
+        resp_words = resp_words - STOP_WORDS
         
         if not req_words:
             return 70.0  # Neutral score if no meaningful words in requirement
@@ -238,7 +258,7 @@ class RFPQualityScorer:
         return min(base_score, 100.0)
     
     def _generate_feedback(self, completeness: float, clarity: float, 
-                          professionalism: float, relevance: float, response: str) -> List[str]:
+                          professionalism: float, relevance: float, word_count: int) -> List[str]:
         """Generate specific feedback for improving the response"""
         feedback = []
         
@@ -254,7 +274,7 @@ class RFPQualityScorer:
         if relevance < 70:
             feedback.append("Response doesn't fully address the requirement. Include more specific details.")
         
-        if len(response.split()) < 30:
+        if word_count < 30:
             feedback.append("Response is too brief. Provide more comprehensive information.")
         
         # Positive feedback for good scores
@@ -277,11 +297,21 @@ class RFPQualityScorer:
             return "Poor"
     
     def score_batch(self, requirements_responses: List[Tuple[str, str]]) -> List[QualityScore]:
-        """Score a batch of requirement-response pairs"""
-        return [
-            self.score_response(req, resp) 
-            for req, resp in requirements_responses
-        ]
+        """Score a batch of requirement-response pairs
+        
+        Each distinct pair is scored once; repeated pairs get their own copy of
+        that score, so callers can still edit one result without affecting another.
+        """
+        scored: Dict[Tuple[str, str], QualityScore] = {}
+        scores = []
+        for pair in requirements_responses:
+            score = scored.get(pair)
+            if score is None:
+                score = scored[pair] = self.score_response(*pair)
+            else:
+                score = replace(score, feedback=list(score.feedback))
+            scores.append(score)
+        return scores
     
     def get_batch_summary(self, scores: List[QualityScore]) -> Dict:
         """Get summary statistics for a batch of scores"""
@@ -1,15 +1,59 @@
 import sys
 from pathlib import Path
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add project root to sys.path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.retrieval.embeddings import embed_text
+from src.retrieval.embeddings import embed_text, embed_texts
 from src.vector_store.vector_store import FAISSStore
 from app.quality_scorer import RFPQualityScorer
 
+# Number of IVF lists probed per query when the store holds a compressed IVF-PQ index
+IVF_NPROBE = 8
+
+# Retrieved chunks less similar than this fraction of the best match are left out of the prompt
+MIN_RELATIVE_SIMILARITY = 0.6
+# Hard cap on the characters each chunk contributes to the prompt
+MAX_CHUNK_CHARS = 800
+
+# Response clean-up patterns, compiled once at import instead of on every answer
+_AI_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"Here's my response:\s*",
+        r"Here's a.*?response:\s*",
+        r"Based on.*?information,?\s*",
+        r"Let me.*?:\s*",
+        r"\*\*Summary:\*\*\s*",
+        r"\*\*Detailed Explanation:\*\*\s*",
+        r"\*\*.*?\*\*\s*",  # Remove any bold markdown
+        r"^Summary:\s*",
+        r"^Detailed Explanation:\s*",
+        r"^Response:\s*",
+        r"^Answer:\s*",
+    )
+]
+_BULLET_RE = re.compile(r"^\s*[-•*]\s*", re.MULTILINE)
+_EXCESS_BREAKS_RE = re.compile(r"\n\s*\n\s*\n")
+_LEADING_SPACE_RE = re.compile(r"^\s+")
+_TRAILING_SPACE_RE = re.compile(r"\s+$")
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.*?)\*")
+
+# Keep-alive connections held open to Ollama; covers ask_batch's concurrent workers
+OLLAMA_POOL_SIZE = 16
+
+# Sampling options sent with every generation request
+GENERATION_OPTIONS = {
+    "temperature": 0.5,
+    "top_p": 0.8
+}
+
 class RAGPipeline:
     def __init__(self, store_dir="test_store", ollama_url="http://localhost:11434", model="llama3"):
         self.store_dir = store_dir
@@ -17,10 +61,20 @@ class RAGPipeline:
         self.model = model
         self.vector_store = None
         self.quality_scorer = RFPQualityScorer()
+        # Resolved once; generate_answer runs for every requirement in a batch
+        self._generate_url = f"{ollama_url}/api/generate"
+        # One session for all requests, so each answer reuses a pooled connection
+        # instead of opening a new TCP connection to Ollama
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=OLLAMA_POOL_SIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         
     def load_vector_store(self):
         """Load the vector store"""
-        self.vector_store = FAISSStore.load(self.store_dir)
+        self.vector_store = FAISSStore.load(self.store_dir, mmap=True)
+        if hasattr(self.vector_store.index, "nprobe"):
+            self.vector_store.index.nprobe = IVF_NPROBE
         print(f"Vector store loaded from {self.store_dir}")
     
     def retrieve_context(self, query: str, top_k: int = 3) -> str:
@@ -34,12 +88,42 @@ class RAGPipeline:
         # Search for similar chunks
         results = self.vector_store.similarity_search(query_embedding, top_k)
         
-        # Extract text content from tuples (id, text, score)
-        texts = [result[1] for result in results]
+        # Combine the relevant retrieved chunks into context
+        return self._build_context(results)
+    
+    def retrieve_contexts(self, queries: list, top_k: int = 3) -> list:
+        """Retrieve relevant chunks for many queries with one embedding pass and one search"""
+        if not queries:
+            return []
+        if not self.vector_store:
+            self.load_vector_store()
+        
+        # Embed all queries in a single batch -> (nq, d) matrix
+        query_embeddings = embed_texts(queries)
+        
+        # One FAISS search for the whole batch
+        batch_results = self.vector_store.similarity_search_batch(query_embeddings, top_k)
+        
+        return [self._build_context(results) for results in batch_results]
+    
+    def _build_context(self, results: list) -> str:
+        """Join (id, text, score) search results into a prompt context
+        
+        Chunks much less similar than the best match are dropped and each chunk is
+        clipped to MAX_CHUNK_CHARS, keeping prompts short for the LLM.
+        """
+        if not results:
+            return ""
+        
+        similarity = self.vector_store.cosine_similarity
+        top_similarity = similarity(results[0][2])
+        cutoff = MIN_RELATIVE_SIMILARITY * top_similarity
         
-        # Combine retrieved chunks into context
-        context = "\n\n".join(texts)
-        return context
+        texts = [results[0][1][:MAX_CHUNK_CHARS]]
+        if top_similarity > 0:
+            texts += [text[:MAX_CHUNK_CHARS] for _, text, score in results[1:]
+                      if similarity(score) >= cutoff]
+        return "\n\n".join(texts)
     
     def generate_answer(self, query: str, context: str) -> str:
         """Generate answer using Ollama"""
@@ -60,16 +144,13 @@ Client Question: {query}
 Your response:"""
 
         try:
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
+            response = self._session.post(
+                self._generate_url,
                 json={
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
-                    "options": {
-                        "temperature": 0.5,
-                        "top_p": 0.8
-                    }
+                    "options": GENERATION_OPTIONS
                 },
                 timeout=60
             )
@@ -85,38 +166,22 @@ Your response:"""
     
     def _humanize_response(self, response: str) -> str:
         """Clean up AI-like formatting to make responses sound more human"""
-        import re
-        
         # Remove common AI phrases and patterns
-        ai_patterns = [
-            r"Here's my response:\s*",
-            r"Here's a.*?response:\s*",
-            r"Based on.*?information,?\s*",
-            r"Let me.*?:\s*",
-            r"\*\*Summary:\*\*\s*",
-            r"\*\*Detailed Explanation:\*\*\s*",
-            r"\*\*.*?\*\*\s*",  # Remove any bold markdown
-            r"^Summary:\s*",
-            r"^Detailed Explanation:\s*",
-            r"^Response:\s*",
-            r"^Answer:\s*",
-        ]
-        
         cleaned = response
-        for pattern in ai_patterns:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE | re.MULTILINE)
+        for pattern in _AI_PATTERNS:
+            cleaned = pattern.sub("", cleaned)
         
         # Remove bullet points and convert to flowing text
-        cleaned = re.sub(r"^\s*[-•*]\s*", "", cleaned, flags=re.MULTILINE)
+        cleaned = _BULLET_RE.sub("", cleaned)
         
         # Remove excessive line breaks and normalize spacing
-        cleaned = re.sub(r"\n\s*\n\s*\n", "\n\n", cleaned)
-        cleaned = re.sub(r"^\s+", "", cleaned)
-        cleaned = re.sub(r"\s+$", "", cleaned)
+        cleaned = _EXCESS_BREAKS_RE.sub("\n\n", cleaned)
+        cleaned = _LEADING_SPACE_RE.sub("", cleaned)
+        cleaned = _TRAILING_SPACE_RE.sub("", cleaned)
         
         # Remove markdown-style formatting
-        cleaned = re.sub(r"\*\*(.*?)\*\*", r"\1", cleaned)  # Bold
-        cleaned = re.sub(r"\*(.*?)\*", r"\1", cleaned)      # Italic
+        cleaned = _BOLD_RE.sub(r"\1", cleaned)    # Bold
+        cleaned = _ITALIC_RE.sub(r"\1", cleaned)  # Italic
         
         return cleaned.strip()
     
@@ -128,10 +193,55 @@ Your response:"""
         context = self.retrieve_context(query, top_k)
         print(f"Retrieved {top_k} chunks")
         
-        # Step 2: Generate answer
+        # Step 2 and 3: Generate answer and score quality
+        return self._answer_with_context(query, context, include_quality_score)
+    
+    def iter_answers(self, queries: list, top_k: int = 3, include_quality_score: bool = True):
+        """Yield ask() results in order, retrieving context for the next query while the LLM answers the current one"""
+        if not queries:
+            return
+        if not self.vector_store:
+            self.load_vector_store()
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_context = executor.submit(self.retrieve_context, queries[0], top_k)
+            for i, query in enumerate(queries):
+                context = next_context.result()
+                if i + 1 < len(queries):
+                    next_context = executor.submit(self.retrieve_context, queries[i + 1], top_k)
+                yield self._answer_with_context(query, context, include_quality_score)
+    
+    def ask_batch(self, queries: list, top_k: int = 3, include_quality_score: bool = True,
+                  progress_callback=None, max_workers: int = 1) -> list:
+        """RAG pipeline over many queries: batched retrieval, then concurrent generation"""
+        if not queries:
+            return []
+        
+        # Step 1: Retrieve context for every query up front
+        contexts = self.retrieve_contexts(queries, top_k)
+        print(f"Retrieved {top_k} chunks for {len(queries)} queries")
+        
+        # Step 2 and 3: Generation is I/O bound on Ollama, so run up to max_workers requests at once.
+        # Results are stored by position to keep the output order stable.
+        results = [None] * len(queries)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(self._answer_with_context, query, context, include_quality_score): i
+                for i, (query, context) in enumerate(zip(queries, contexts))
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                
+                # Callback runs on the calling thread (safe for Streamlit widgets)
+                if progress_callback:
+                    progress_callback(completed, len(queries))
+        
+        return results
+    
+    def _answer_with_context(self, query: str, context: str, include_quality_score: bool = True) -> dict:
+        """Generate and optionally score an answer for a query with pre-fetched context"""
         answer = self.generate_answer(query, context)
         
-        # Step 3: Score response quality (if enabled)
         quality_score = None
         if include_quality_score:
             quality_score = self.quality_scorer.score_response(query, answer)
@@ -159,17 +269,34 @@ Your response:"""
         return result
     
     def process_requirements_batch(self, requirements: list, top_k: int = 3, progress_callback=None) -> list:
-        """Process multiple requirements in batch"""
+        """Process multiple requirements in batch, retrieving all contexts with a single search"""
         results = []
         total_requirements = len(requirements)
         
         print(f"Processing {total_requirements} requirements...")
         
-        for i, requirement in enumerate(requirements):
+        # One embedding pass and one FAISS search for every requirement
+        try:
+            contexts = self.retrieve_contexts(requirements, top_k)
+        except Exception as e:
+            # Without contexts no requirement can be answered; mark them all failed at once
+            print(f"Error retrieving context: {e}")
+            if progress_callback and total_requirements:
+                progress_callback(total_requirements, total_requirements)
+            return [
+                {
+                    "requirement": requirement,
+                    "response": f"Error processing requirement: {str(e)}",
+                    "status": "error"
+                }
+                for requirement in requirements
+            ]
+        
+        for i, (requirement, context) in enumerate(zip(requirements, contexts)):
             print(f"Processing requirement {i+1}/{total_requirements}")
             
             try:
-                result = self.ask(requirement, top_k)
+                result = self._answer_with_context(requirement, context)
                 results.append({
                     "requirement": requirement,
                     "response": result["answer"],
@@ -0,0 +1,75 @@
+import sys
+import math
+import shutil
+from pathlib import Path
+
+import faiss
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.vector_store.vector_store import FAISSStore
+
+PQ_NBITS = 8
+# FAISS needs roughly 39 training points per centroid, both for the IVF
+# lists and for each 2**PQ_NBITS-entry PQ codebook
+MIN_POINTS_PER_CENTROID = 39
+
+def rebuild_store(store_dir="test_store", flat_dir="test_store_flat"):
+    """Compress a full-precision store (flat or HNSW) into an IVF-PQ index.
+
+    The original store is kept in flat_dir so results can be checked
+    against it. Re-running the script on a compressed store rebuilds from
+    that copy, as long as the store holds the same vectors as the copy.
+    """
+    store_path = Path(store_dir)
+    flat_path = Path(flat_dir)
+
+    flat_store = FAISSStore.load(str(store_path))
+    # FAISSStore turns flat indexes into HNSW once they grow, which happens well
+    # before there are enough vectors to train IVF-PQ; both keep raw FP32 vectors
+    if isinstance(flat_store.index, (faiss.IndexFlat, faiss.IndexHNSWFlat)):
+        source_dir = store_path
+    elif flat_path.exists():
+        # PQ codes cannot be expanded back to the original vectors, so documents
+        # added after the last compression are missing from the backup copy
+        backup = FAISSStore.load(str(flat_path))
+        if backup.index.ntotal != flat_store.index.ntotal:
+            print(f"{store_dir} holds {flat_store.index.ntotal} vectors but {flat_dir} holds "
+                  f"{backup.index.ntotal}. Re-index {store_dir} into a flat store before rebuilding.")
+            return
+        flat_store, source_dir = backup, flat_path
+    else:
+        print(f"{store_dir} does not hold a flat or HNSW index, nothing to rebuild.")
+        return
+
+    flat_index = flat_store.index
+    n, d = flat_index.ntotal, flat_index.d
+    nlist = max(1, int(math.sqrt(n)))
+    m = d // 4
+    if n < MIN_POINTS_PER_CENTROID * max(nlist, 2 ** PQ_NBITS):
+        print(f"Only {n} vectors, too few to train IVF-PQ. Keeping the flat index.")
+        return
+
+    if source_dir == store_path:
+        # Refresh the backup so it always matches the store being compressed
+        if flat_path.exists():
+            shutil.rmtree(flat_path)
+        shutil.copytree(store_path, flat_path)
+        print(f"Original index backed up to {flat_dir}")
+
+    vectors = flat_index.reconstruct_n(0, n)
+    # Keep the store's metric so search scores mean the same after compression
+    metric = flat_index.metric_type
+    quantizer = faiss.IndexFlat(d, metric)
+    index = faiss.IndexIVFPQ(quantizer, d, nlist, m, PQ_NBITS, metric)
+    index.train(vectors)
+    index.add(vectors)
+    print(f"Trained IVF-PQ index: nlist={nlist}, M={m}, nbits={PQ_NBITS}")
+
+    flat_store.index = index
+    flat_store.save(store_dir)
+    print(f"Compressed vector store saved to {store_dir}")
+
+if __name__ == "__main__":
+    rebuild_store()
@@ -1,6 +1,7 @@
 import streamlit as st
 import sys
 import os
+import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -9,8 +10,50 @@ from app.interfaces import (
     upload_rfp_interface, 
     direct_query_interface
 )
-from app.ui_components import display_sidebar_status
-from app.processing_utils import initialize_session_state
+from app.ui_components import (
+    display_sidebar_status,
+    display_requirements_list,
+    save_uploaded_file_temporarily,
+    format_duration,
+    quality_emoji_for,
+    add_display_fields,
+    mark_responses_changed
+)
+from app.processing_utils import initialize_session_state, get_rag_pipeline
+from vector_store.vector_store import FAISSStore
+
+def summarize_responses(results):
+    """Compute the response summary statistics in a single pass"""
+    successful = 0
+    total_length = 0
+    quality_total = 0
+    quality_count = 0
+    status_counts = {}
+    for r in results:
+        if r['status'] == 'success':
+            successful += 1
+        total_length += len(r['response'])
+        if r.get("quality_score"):
+            quality_total += r["quality_score"]
+            quality_count += 1
+        status = r.get("quality_status", "Unknown")
+        status_counts[status] = status_counts.get(status, 0) + 1
+    
+    return {
+        "total": len(results),
+        "successful_responses": successful,
+        "avg_response_length": total_length / len(results) if results else 0,
+        "avg_quality": quality_total / quality_count if quality_count else None,
+        "status_counts": status_counts
+    }
+
+def get_response_stats():
+    """Summary statistics for st.session_state.responses, recomputed only when the responses change"""
+    version = st.session_state.get('responses_version', 0)
+    cached = st.session_state.get('response_stats')
+    if cached is None or cached[0] != version:
+        cached = st.session_state.response_stats = (version, summarize_responses(st.session_state.responses))
+    return cached[1]
 
 def main():
     st.set_page_config(
@@ -36,12 +79,11 @@ def main():
         st.markdown("## 📊 System Status")
         
         # Vector store status (common to both tabs)
-        vector_store_exists = Path("test_store/index.faiss").exists() and Path("test_store/docstore.pkl").exists()
+        vector_store_exists = FAISSStore.exists("test_store")
         if vector_store_exists:
             try:
-                from vector_store.vector_store import FAISSStore
-                store = FAISSStore.load("test_store")
-                st.success(f"✅ Vector store ready ({len(store.texts)} documents)")
+                store = FAISSStore.load("test_store", mmap=True)
+                st.success(f"✅ Vector store ready ({len(store.document_map)} documents)")
             except:
                 st.success("✅ Vector store ready")
         else:
@@ -62,13 +104,10 @@ def main():
             st.success(f"✅ {len(st.session_state.responses)} responses generated")
             
             # Quality Summary
-            quality_scores = [resp.get("quality_score", 0) for resp in st.session_state.responses if resp.get("quality_score")]
-            if quality_scores:
-                avg_quality = sum(quality_scores) / len(quality_scores)
-                status_counts = {}
-                for resp in st.session_state.responses:
-                    status = resp.get("quality_status", "Unknown")
-                    status_counts[status] = status_counts.get(status, 0) + 1
+            stats = get_response_stats()
+            if stats["avg_quality"] is not None:
+                avg_quality = stats["avg_quality"]
+                status_counts = stats["status_counts"]
                 
                 # Quality overview
                 st.metric("📊 Avg Quality", f"{avg_quality:.1f}/100")
@@ -87,7 +126,7 @@ def main():
         if st.button("🗑️ Clear All Data"):
             # Clear all session state
             for key in list(st.session_state.keys()):
-                if key in ['requirements', 'responses', 'vector_store_ready', 'extraction_metadata', 'validation_result', 'temp_file_path']:
+                if key in ['requirements', 'responses', 'vector_store_ready', 'extraction_metadata', 'validation_result', 'temp_file_path', 'response_stats']:
                     del st.session_state[key]
             st.success("All data cleared!")
             st.experimental_rerun()
@@ -197,9 +236,7 @@ def upload_rfp_interface():
         if st.button("🔍 Extract Requirements", type="primary", key="extract_button"):
             with st.spinner("Extracting requirements from document..."):
                 # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f".{rfp_file.name.split('.')[-1]}") as temp_file:
-                    temp_file.write(rfp_file.getvalue())
-                    temp_path = temp_file.name
+                temp_path = save_uploaded_file_temporarily(rfp_file)
                 
                 try:
                     from ingestion.requirement_extractor import RequirementExtractor
@@ -258,7 +295,7 @@ def direct_query_interface():
     st.markdown("Query the organizational knowledge base directly without uploading documents.")
     
     # Check vector store status first
-    vector_store_exists = Path("test_store/index.faiss").exists() and Path("test_store/docstore.pkl").exists()
+    vector_store_exists = FAISSStore.exists("test_store")
     
     if not vector_store_exists:
         st.error("❌ No knowledge base found. Please upload documents to the 'Index RFP Responses' tab first.")
@@ -309,8 +346,8 @@ def direct_query_interface():
         if query.strip():
             with st.spinner("Searching knowledge base and generating response..."):
                 try:
-                    # Initialize RAG pipeline
-                    rag = RAGPipeline(model=ollama_model)
+                    # Reuse the cached RAG pipeline
+                    rag = get_rag_pipeline(ollama_model)
                     
                     # Get response
                     result = rag.ask(query.strip(), top_k)
@@ -335,7 +372,7 @@ def direct_query_interface():
                         st.markdown("### 🤖 Response")
                     with col2:
                         quality_score = result.get("quality_score", 0)
-                        quality_emoji = "🌟" if quality_score >= 80 else "✅" if quality_score >= 60 else "⚠️" if quality_score >= 40 else "❌"
+                        quality_emoji = quality_emoji_for(quality_score)
                         st.metric("Quality", f"{quality_emoji} {quality_score:.0f}/100")
                     with col3:
                         st.metric("Context", f"{len(result.get('context', '').split(chr(10)+chr(10)))} chunks")
@@ -438,12 +475,10 @@ def show_requirements_and_generate():
                 st.experimental_rerun()
         else:
             # Just display requirements
-            for i, req in enumerate(st.session_state.requirements, 1):
-                with st.expander(f"Requirement {i}", expanded=False):
-                    st.write(req)
+            display_requirements_list(st.session_state.requirements)
         
         # Check Vector Store Status and Generate Responses
-        vector_store_exists = Path("test_store/index.faiss").exists() and Path("test_store/docstore.pkl").exists()
+        vector_store_exists = FAISSStore.exists("test_store")
         
         if vector_store_exists:
             st.session_state.vector_store_ready = True
@@ -451,9 +486,8 @@ def show_requirements_and_generate():
                 st.success("✅ Using organizational knowledge base")
                 if st.button("🔍 Inspect Vector Store", key="inspect_store"):
                     try:
-                        from vector_store.vector_store import FAISSStore
-                        store = FAISSStore.load("test_store")
-                        st.write(f"Vector store contains {len(store.texts)} documents")
+                        store = FAISSStore.load("test_store", mmap=True)
+                        st.write(f"Vector store contains {len(store.document_map)} documents")
                     except Exception as e:
                         st.error(f"Error inspecting vector store: {e}")
             
@@ -489,8 +523,8 @@ def show_requirements_and_generate():
                 st.info(f"Will process requirements {start_from} to {start_from + actual_batch_size - 1}")
                 
                 if st.button(f"🚀 Generate Responses (Batch: {start_from}-{start_from + actual_batch_size - 1})", type="primary", key="generate_batch"):
-                    # Initialize RAG pipeline
-                    rag = RAGPipeline(model=ollama_model)
+                    # Reuse the cached RAG pipeline
+                    rag = get_rag_pipeline(ollama_model)
                     
                     # Process only the selected batch
                     selected_requirements = st.session_state.requirements[start_from-1:start_from-1+actual_batch_size]
@@ -505,8 +539,8 @@ def show_requirements_and_generate():
 def generate_all_responses_interface(top_k, ollama_model):
     """Handle the generation of all responses interface"""
     if st.button("🚀 Generate All Responses", type="primary", key="generate_responses"):
-        # Initialize RAG pipeline
-        rag = RAGPipeline(model=ollama_model)
+        # Reuse the cached RAG pipeline
+        rag = get_rag_pipeline(ollama_model)
         
         # Progress tracking
         progress_bar = st.progress(0)
@@ -524,16 +558,18 @@ def generate_all_responses_interface(top_k, ollama_model):
                 eta_display = st.empty()
         
         results = []
-        start_time = datetime.now()
+        start_time = time.monotonic()
         
         try:
+            # Retrieval for the next requirement overlaps with LLM generation for the current one
+            answers = rag.iter_answers(st.session_state.requirements, top_k)
             for i, requirement in enumerate(st.session_state.requirements):
                 # Update current processing status
                 current_processing.info(f"🔄 Processing {i+1}/{len(st.session_state.requirements)}")
                 status_text.text(f"Processing: {requirement[:80]}...")
                 
                 # Process requirement
-                result = rag.ask(requirement, top_k)
+                result = next(answers)
                 
                 results.append({
                     "requirement": requirement,
@@ -554,21 +590,22 @@ def generate_all_responses_interface(top_k, ollama_model):
                 
                 # Calculate and display ETA
                 if i > 0:  # Calculate ETA after first item
-                    elapsed = datetime.now() - start_time
-                    avg_time_per_req = elapsed / (i + 1)
+                    elapsed = time.monotonic() - start_time
                     remaining_reqs = len(st.session_state.requirements) - (i + 1)
-                    eta = avg_time_per_req * remaining_reqs
-                    eta_display.info(f"⏱️ ETA: {str(eta).split('.')[0]}")
+                    eta = elapsed / (i + 1) * remaining_reqs
+                    eta_display.info(f"⏱️ ETA: {format_duration(eta)}")
             
+            add_display_fields(results)
             st.session_state.responses = results
+            mark_responses_changed()
             
             # Clear progress displays and show completion
             progress_container.empty()
             status_text.empty()
             
             # Display final results
-            completion_time = datetime.now() - start_time
-            st.success(f"🎉 Generated responses for all {len(results)} requirements in {str(completion_time).split('.')[0]}!")
+            completion_time = time.monotonic() - start_time
+            st.success(f"🎉 Generated responses for all {len(results)} requirements in {format_duration(completion_time)}!")
             
             # Show preview of results
             show_response_preview(results)
@@ -588,12 +625,12 @@ def show_response_preview(results):
             for i, result in enumerate(results, 1):
                 with st.container():
                     # Header with quality indicator
-                    quality_emoji = "🌟" if result.get("quality_status") == "Excellent" else "✅" if result.get("quality_status") == "Good" else "⚠️" if result.get("quality_status") == "Needs Review" else "❌"
+                    quality_emoji = result['_emoji']
                     quality_score = result.get("quality_score", 0)
                     
                     col1, col2 = st.columns([4, 1])
                     with col1:
-                        st.markdown(f"**{i}. {result['requirement'][:100]}{'...' if len(result['requirement']) > 100 else ''}**")
+                        st.markdown(f"**{i}. {result['_preview']}**")
                     with col2:
                         st.markdown(f"{quality_emoji} **{quality_score:.0f}/100**")
                     
@@ -626,12 +663,12 @@ def show_response_preview(results):
             for i, result in enumerate(results[:3], 1):
                 with st.container():
                     # Header with quality indicator
-                    quality_emoji = "🌟" if result.get("quality_status") == "Excellent" else "✅" if result.get("quality_status") == "Good" else "⚠️" if result.get("quality_status") == "Needs Review" else "❌"
+                    quality_emoji = result['_emoji']
                     quality_score = result.get("quality_score", 0)
                     
                     col1, col2 = st.columns([4, 1])
                     with col1:
-                        st.markdown(f"**{i}. {result['requirement'][:100]}{'...' if len(result['requirement']) > 100 else ''}**")
+                        st.markdown(f"**{i}. {result['_preview']}**")
                     with col2:
                         st.markdown(f"{quality_emoji} **{quality_score:.0f}/100**")
                     
@@ -663,8 +700,9 @@ def show_response_preview(results):
             st.info(f"📊 Showing first 3 of {len(results)} responses. Download the complete results below to see all responses.")
             
             # Show summary statistics
-            avg_response_length = sum(len(r['response']) for r in results) / len(results)
-            successful_responses = sum(1 for r in results if r['status'] == 'success')
+            stats = get_response_stats()
+            avg_response_length = stats["avg_response_length"]
+            successful_responses = stats["successful_responses"]
             
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -1,16 +1,62 @@
+import os
+
+# Configure OpenMP/BLAS threading before numpy, torch or faiss are imported: passive
+# OpenMP waiting stops FAISS worker threads from spinning against the BLAS pool.
+# setdefault keeps any values already exported in the environment. OMP_NUM_THREADS is
+# left alone so torch keeps all cores for query embedding; FAISSStore caps its own
+# searches to SEARCH_OMP_THREADS.
+os.environ.setdefault('OMP_WAIT_POLICY', 'PASSIVE')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', str(os.cpu_count()))
+os.environ.setdefault('MKL_NUM_THREADS', str(os.cpu_count()))
+
 import streamlit as st
 from pathlib import Path
 import sys
-import os
-import tempfile
+import re
+import hashlib
+import time
 from datetime import datetime
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ingestion.requirement_extractor import extract_requirements_from_file
-from app.rag_pipeline import RAGPipeline
+from ingestion.requirement_extractor import iter_requirements_from_bytes
+from app.processing_utils import get_rag_pipeline
 from app.output_generator import OutputGenerator
 from app.pdf_generator import PDFGenerator
+from app.ui_components import display_requirements_list, is_vector_store_ready, mark_responses_changed
+
+# Minimum seconds between progress widget updates during generation
+UI_UPDATE_INTERVAL = 0.1
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_requirement(text: str) -> str:
+    """Key used to spot repeated requirements: case, whitespace and trailing punctuation are ignored"""
+    return _WHITESPACE_RE.sub(' ', text.strip().lower()).rstrip(' .?!;:')
+
+def unique_requirements(requirements: list) -> dict:
+    """Normalized key -> first requirement with it, in first-seen order"""
+    unique = {}
+    for requirement in requirements:
+        unique.setdefault(normalize_requirement(requirement), requirement)
+    return unique
+
+def fan_out_answers(requirements: list, unique: dict, answers: list) -> list:
+    """One result per original requirement, duplicates included, from the answers to unique.values()"""
+    answers_by_key = dict(zip(unique.keys(), answers))
+    return [
+        {
+            "requirement": requirement,
+            "response": answers_by_key[normalize_requirement(requirement)]["answer"],
+            "status": "success"
+        }
+        for requirement in requirements
+    ]
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def extract_requirements_cached(content_hash: str, _content: bytes, suffix: str) -> list:
+    """Requirements of an uploaded file, cached by content hash so re-extracting the same upload is instant"""
+    return list(iter_requirements_from_bytes(_content, suffix))
 
 def main():
     st.set_page_config(
@@ -27,10 +73,13 @@ def main():
         st.session_state.requirements = []
     if 'responses' not in st.session_state:
         st.session_state.responses = []
+    if 'export_df' not in st.session_state:
+        st.session_state.export_df = None
+    if 'download_bytes' not in st.session_state:
+        st.session_state.download_bytes = {}
     
     # Check if vector store exists
-    vector_store_path = Path("test_store")
-    vector_store_ready = vector_store_path.exists() and (vector_store_path / "index.faiss").exists()
+    vector_store_ready = is_vector_store_ready("test_store")
     
     if not vector_store_ready:
         st.error("❌ Vector store not found! Please ensure your knowledge base is properly set up in the 'test_store' directory.")
@@ -49,14 +98,14 @@ def main():
     if rfp_file:
         if st.button("🔍 Extract Requirements", type="primary"):
             with st.spinner("Extracting requirements from document..."):
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f".{rfp_file.name.split('.')[-1]}") as temp_file:
-                    temp_file.write(rfp_file.getvalue())
-                    temp_path = temp_file.name
+                # Parse the upload straight from memory; no temporary file round-trip
+                file_bytes = rfp_file.getvalue()
+                file_suffix = Path(rfp_file.name).suffix
                 
                 try:
-                    # Extract requirements
-                    requirements = extract_requirements_from_file(temp_path)
+                    # Identical uploads hit the cache; only the digest is hashed by Streamlit
+                    content_hash = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+                    requirements = extract_requirements_cached(content_hash, file_bytes, file_suffix)
                     st.session_state.requirements = requirements
                     
                     if requirements:
@@ -67,15 +116,11 @@ def main():
                         # Show extracted text for debugging
                         from ingestion.requirement_extractor import RequirementExtractor
                         extractor = RequirementExtractor()
-                        full_text = extractor._extract_text(temp_path)
+                        full_text = extractor.extract_text_from_bytes(file_bytes, file_suffix)
                         st.text_area("Raw text extracted from document:", full_text[:1000] + "..." if len(full_text) > 1000 else full_text, height=200)
                     
                 except Exception as e:
                     st.error(f"Error extracting requirements: {str(e)}")
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
     
     # Show extracted requirements
     if st.session_state.requirements:
@@ -104,9 +149,7 @@ def main():
                 st.experimental_rerun()
         else:
             # Just display requirements
-            for i, req in enumerate(st.session_state.requirements, 1):
-                with st.expander(f"Requirement {i}", expanded=False):
-                    st.write(req)
+            display_requirements_list(st.session_state.requirements)
         
         # Step 3: Generate Responses
         st.header("⚡ Step 3: Generate Responses")
@@ -118,37 +161,57 @@ def main():
         with col2:
             ollama_model = st.selectbox("Ollama Model", ["llama3", "llama2", "mistral", "codellama"], index=0)
         
+        with st.sidebar:
+            parallel_calls = st.slider(
+                "Parallel LLM calls", 1, 8, 4,
+                help="Number of concurrent requests sent to Ollama. Match this to Ollama's OLLAMA_NUM_PARALLEL setting."
+            )
+        
         if st.button("🚀 Generate All Responses", type="primary"):
-            # Initialize RAG pipeline with existing vector store
-            rag = RAGPipeline(model=ollama_model, store_dir="test_store")
+            # Reuse the cached RAG pipeline with existing vector store
+            rag = get_rag_pipeline(ollama_model)
             
             # Progress tracking
             progress_bar = st.progress(0)
             status_text = st.empty()
-            results_container = st.container()
-            
-            results = []
             
             try:
-                for i, requirement in enumerate(st.session_state.requirements):
-                    status_text.text(f"Processing requirement {i+1}/{len(st.session_state.requirements)}: {requirement[:50]}...")
-                    
-                    # Process requirement using existing vector store
-                    result = rag.ask(requirement, top_k)
-                    results.append({
-                        "requirement": requirement,
-                        "response": result["answer"],
-                        "status": "success"
-                    })
-                    
-                    # Update progress
-                    progress_bar.progress((i + 1) / len(st.session_state.requirements))
+                requirements = st.session_state.requirements
+                
+                # Send each distinct requirement through retrieval and the LLM only once
+                unique = unique_requirements(requirements)
+                
+                status_text.text(f"Retrieving context for {len(unique)} unique requirements...")
+                
+                last_ui_update = 0.0
+                
+                def update_progress(completed, total):
+                    # Throttle frontend updates; always render the final state
+                    nonlocal last_ui_update
+                    now = time.monotonic()
+                    if completed < total and now - last_ui_update < UI_UPDATE_INTERVAL:
+                        return
+                    last_ui_update = now
                     
-                    # Show progress in real-time
-                    with results_container:
-                        st.write(f"✅ Completed requirement {i+1}")
+                    status_text.text(f"Processed {completed}/{total} requirements...")
+                    progress_bar.progress(completed / total)
+                
+                # Retrieval runs once for all requirements; LLM generation drives the progress bar
+                answers = rag.ask_batch(
+                    list(unique.values()), top_k,
+                    progress_callback=update_progress,
+                    max_workers=parallel_calls
+                )
+                
+                # Fan the answers back out to every original requirement, duplicates included
+                results = fan_out_answers(requirements, unique, answers)
                 
                 st.session_state.responses = results
+                mark_responses_changed()
+                # Build the export table once; Excel and CSV downloads share it on every rerun
+                st.session_state.export_df = OutputGenerator.results_to_dataframe(results)
+                st.session_state.responses_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                st.session_state.download_bytes = {}
                 status_text.text("✅ All responses generated successfully!")
                 
                 # Display results summary
@@ -175,21 +238,28 @@ def main():
         
         st.success(f"Ready to download results for {len(st.session_state.responses)} requirements!")
         
+        export_df = st.session_state.export_df
+        if export_df is None:
+            export_df = st.session_state.export_df = OutputGenerator.results_to_dataframe(st.session_state.responses)
+        if 'responses_timestamp' not in st.session_state:
+            st.session_state.responses_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = st.session_state.responses_timestamp
+        
+        # Each file is generated once per set of responses, not on every rerun
+        download_bytes = st.session_state.download_bytes
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.subheader("📊 Excel Format")
             try:
-                output_gen = OutputGenerator()
-                excel_bytes = output_gen.generate_excel_bytes(st.session_state.responses)
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"rfp_responses_{timestamp}.xlsx"
+                if 'excel' not in download_bytes:
+                    download_bytes['excel'] = OutputGenerator().generate_excel_bytes(export_df)
                 
                 st.download_button(
                     label="⬇️ Download Excel",
-                    data=excel_bytes,
-                    file_name=filename,
+                    data=download_bytes['excel'],
+                    file_name=f"rfp_responses_{timestamp}.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     type="primary"
                 )
@@ -199,16 +269,13 @@ def main():
         with col2:
             st.subheader("📄 PDF Format")
             try:
-                pdf_gen = PDFGenerator()
-                pdf_bytes = pdf_gen.generate_pdf_bytes(st.session_state.responses, "RFP Response Document")
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"rfp_responses_{timestamp}.pdf"
+                if 'pdf' not in download_bytes:
+                    download_bytes['pdf'] = PDFGenerator().generate_pdf_bytes(st.session_state.responses, "RFP Response Document")
                 
                 st.download_button(
                     label="⬇️ Download PDF",
-                    data=pdf_bytes,
-                    file_name=filename,
+                    data=download_bytes['pdf'],
+                    file_name=f"rfp_responses_{timestamp}.pdf",
                     mime="application/pdf",
                     type="primary"
                 )
@@ -218,16 +285,13 @@ def main():
         with col3:
             st.subheader("📋 CSV Format")
             try:
-                output_gen = OutputGenerator()
-                csv_bytes = output_gen.generate_csv_bytes(st.session_state.responses)
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"rfp_responses_{timestamp}.csv"
+                if 'csv' not in download_bytes:
+                    download_bytes['csv'] = OutputGenerator().generate_csv_bytes(export_df)
                 
                 st.download_button(
                     label="⬇️ Download CSV",
-                    data=csv_bytes,
-                    file_name=filename,
+                    data=download_bytes['csv'],
+                    file_name=f"rfp_responses_{timestamp}.csv",
                     mime="text/csv"
                 )
             except Exception as e:
@@ -261,6 +325,10 @@ def main():
         if st.button("🗑️ Clear Session Data"):
             st.session_state.requirements = []
             st.session_state.responses = []
+            mark_responses_changed()
+            st.session_state.export_df = None
+            st.session_state.download_bytes = {}
+            st.session_state.pop('responses_timestamp', None)
             st.success("Session data cleared!")
             st.experimental_rerun()
         
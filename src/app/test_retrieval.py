@@ -1,23 +1,37 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 
 # Add project root to sys.path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.retrieval.embeddings import embed_text
+from src.retrieval.embeddings import embed_texts
 from src.vector_store.vector_store import FAISSStore
 
-def test_query(query, store_dir="test_store"):
-    # Load the vector store
-    store = FAISSStore.load(store_dir)
-    # Embed the query
-    query_embedding = embed_text(query)
-    # Search for top 3 similar chunks
-    results = store.similarity_search(query_embedding, 3)
-    print("Top results:")
-    for i, chunk in enumerate(results):
-        print(f"\nResult {i+1}:\n{chunk}")
+@lru_cache(maxsize=None)
+def get_store(store_dir="test_store"):
+    # Load the vector store once per process
+    return FAISSStore.load(store_dir, mmap=True)
+
+def test_query(queries, store_dir="test_store", k=3):
+    """Print the top k chunks for each query and return FAISS's (distances, indices) arrays"""
+    store = get_store(store_dir)
+    # Embed all queries in one batch -> (nq, d)
+    query_embeddings = embed_texts(queries)
+    # Search for the top k similar chunks of every query with a single FAISS call
+    distances, indices = store.index.search(np.ascontiguousarray(query_embeddings, dtype=np.float32), k)
+    for query, row_distances, row_indices in zip(queries, distances, indices):
+        print(f"\nTop results for: {query}")
+        for i, (idx, distance) in enumerate(zip(row_indices, row_distances)):
+            if idx == -1:
+                continue
+            print(f"\nResult {i+1}:\n{(int(idx), store.document_map[int(idx)], float(distance))}")
+    # FAISS already returns (nq, k) arrays; hand them back without copying
+    return distances, indices
 
 if __name__ == "__main__":
-    query = input("Enter your query: ")
-    test_query(query)
\ No newline at end of file
+    print("Enter one query per line (Ctrl-D to finish):")
+    queries = [line.strip() for line in sys.stdin if line.strip()]
+    if queries:
+        test_query(queries)
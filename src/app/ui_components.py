@@ -4,12 +4,46 @@ UI Components and Helper Functions for Streamlit App
 import streamlit as st
 import pandas as pd
 import io
+import html
+import time
+import contextlib
 import tempfile
+import shutil
 import os
 from pathlib import Path
-from datetime import datetime
+from openpyxl import Workbook
 
+try:
+    import xlsxwriter
+except ImportError:  # optional: faster streaming writer for large exports
+    xlsxwriter = None
 
+try:
+    import pyarrow
+except ImportError:  # optional: Arrow-backed columns for template frames
+    pyarrow = None
+
+# DataFrames at least this long are streamed through a write-only workbook
+STREAMING_EXCEL_MIN_ROWS = 100
+# Excel downloads are built in memory up to this size, then spill to a temp file
+EXCEL_SPOOL_MAX_SIZE = 10 * 1024 * 1024
+
+# Quality emoji for every integer score 0-100
+_QUALITY_EMOJI = ("❌",) * 40 + ("⚠️",) * 20 + ("✅",) * 20 + ("🌟",) * 21
+
+# Minimum seconds between redraws of a placeholder-backed progress display
+PROGRESS_MIN_INTERVAL = 0.5
+_last_progress_update = {}
+
+
+def _template_frame(data):
+    """Build a template DataFrame, backed by Arrow buffers when pyarrow is installed"""
+    if pyarrow is None:
+        return pd.DataFrame(data)
+    return pyarrow.Table.from_pydict(data).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+@st.cache_data(show_spinner=False)
 def create_sample_rfp_template():
     """Create and return sample RFP template data"""
     template_data = {
@@ -24,9 +58,10 @@ def create_sample_rfp_template():
         'Priority': ['High', 'High', 'Medium', 'Low', 'Medium'],
         'Category': ['Experience', 'Management', 'Security', 'Qualifications', 'Support']
     }
-    return pd.DataFrame(template_data)
+    return _template_frame(template_data)
 
 
+@st.cache_data(show_spinner=False)
 def create_sample_indexing_template():
     """Create and return sample indexing template data"""
     sample_data = {
@@ -43,18 +78,70 @@ def create_sample_indexing_template():
             'Our team holds various industry certifications including AWS Solutions Architect, Microsoft Azure Expert, PMP, CISSP, and CISA. We maintain continuous education programs to stay current with technology trends.'
         ]
     }
-    return pd.DataFrame(sample_data)
+    return _template_frame(sample_data)
+
+
+def _excel_cell(value):
+    """Cell value for the streaming writers, matching what pandas' to_excel writes
+    
+    Missing scalars (NaN, None, NaT) become blank cells and non-scalar values
+    such as lists or arrays are written as their string form.
+    """
+    if not pd.api.types.is_scalar(value):
+        return str(value)
+    return None if pd.isna(value) else value
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def dataframe_to_excel_bytes(df):
+    """Serialize a DataFrame to xlsx bytes, streaming rows for larger frames
+    
+    Cached on the frame's contents, so reruns that render the same download
+    button reuse the existing bytes instead of serializing again. Large
+    workbooks spill to disk while being written rather than growing a buffer.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE) as output:
+        if len(df) < STREAMING_EXCEL_MIN_ROWS:
+            with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                df.to_excel(writer, sheet_name='Data', index=False)
+        elif xlsxwriter is not None:
+            # constant_memory flushes each row as it is written, keeping peak RAM flat
+            workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+            worksheet = workbook.add_worksheet('Data')
+            worksheet.write_row(0, 0, [str(column) for column in df.columns])
+            for row_idx, row in enumerate(df.itertuples(index=False, name=None), 1):
+                worksheet.write_row(row_idx, 0, [_excel_cell(value) for value in row])
+            workbook.close()
+        else:
+            # Write-only workbooks append rows straight to the output without a cell object model
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Data')
+            worksheet.append([str(column) for column in df.columns])
+            for row in df.itertuples(index=False, name=None):
+                worksheet.append([_excel_cell(value) for value in row])
+            workbook.save(output)
+        
+        output.seek(0)
+        return output.read()
+
+
+_TEMPLATE_BUILDERS = {
+    'rfp_requirements': create_sample_rfp_template,
+    'sample_rfp_responses': create_sample_indexing_template
+}
+
+
+@st.cache_data(show_spinner=False)
+def template_xlsx_bytes(name):
+    """Serialized sample template, built once and shared across reruns"""
+    return dataframe_to_excel_bytes(_TEMPLATE_BUILDERS[name]())
 
 
 def generate_excel_download_button(df, filename, label, button_key=None):
     """Generate Excel download button for DataFrame"""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Data', index=False)
-    
     return st.download_button(
         label=label,
-        data=output.getvalue(),
+        data=dataframe_to_excel_bytes(df),
         file_name=filename,
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         key=button_key
@@ -81,13 +168,13 @@ def show_file_format_guidelines():
         """)
         
         st.markdown("**📥 Need a template?**")
-        if st.button("⬇️ Download Sample Excel Template", key="download_template"):
-            template_df = create_sample_rfp_template()
-            generate_excel_download_button(
-                template_df, 
-                "rfp_requirements_template.xlsx",
-                "📄 Download Template"
-            )
+        st.download_button(
+            label="⬇️ Download Sample Excel Template",
+            data=template_xlsx_bytes('rfp_requirements'),
+            file_name="rfp_requirements_template.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="download_template"
+        )
 
 
 def show_indexing_format_guidelines():
@@ -111,13 +198,13 @@ def show_indexing_format_guidelines():
         ```
         """)
         
-        if st.button("⬇️ Download Sample Template", key="download_index_template"):
-            sample_df = create_sample_indexing_template()
-            generate_excel_download_button(
-                sample_df,
-                "sample_rfp_responses.xlsx", 
-                "📄 Download Sample RFP Responses Template"
-            )
+        st.download_button(
+            label="⬇️ Download Sample Template",
+            data=template_xlsx_bytes('sample_rfp_responses'),
+            file_name="sample_rfp_responses.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="download_index_template"
+        )
 
 
 def show_quick_question_templates(input_key):
@@ -145,13 +232,18 @@ def show_quick_question_templates(input_key):
                     st.experimental_rerun()
 
 
+def quality_emoji_for(quality_score):
+    """Return the emoji for a 0-100 quality score"""
+    return _QUALITY_EMOJI[min(max(int(quality_score), 0), 100)]
+
+
 def display_quality_metrics(result, show_breakdown=True):
     """Display quality metrics for a response"""
     quality_score = result.get("quality_score", 0)
     quality_status = result.get("quality_status", "Unknown")
     
-    # Quality emoji
-    quality_emoji = "🌟" if quality_score >= 80 else "✅" if quality_score >= 60 else "⚠️" if quality_score >= 40 else "❌"
+    # Stored results carry the emoji from add_display_fields; direct answers do not
+    quality_emoji = result.get('_emoji') or quality_emoji_for(quality_score)
     
     col1, col2 = st.columns(2)
     with col1:
@@ -178,36 +270,91 @@ def display_quality_metrics(result, show_breakdown=True):
                     st.info(f"💡 {feedback}")
 
 
-def display_progress_tracking(current, total, current_item=None, start_time=None):
-    """Display progress tracking components"""
-    progress_bar = st.progress(current / total if total > 0 else 0)
+def format_duration(seconds):
+    """Format a duration in seconds as HH:MM:SS"""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def display_progress_tracking(current, total, current_item=None, start_time=None,
+                              placeholder=None, min_interval=PROGRESS_MIN_INTERVAL):
+    """Display progress tracking components
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.success(f"✅ Completed: {current}/{total}")
-    with col2:
-        if current_item:
-            st.info(f"🔄 Processing: {current_item[:50]}...")
-    with col3:
-        if start_time and current > 0:
-            elapsed = datetime.now() - start_time
-            avg_time = elapsed / current
-            remaining = total - current
-            eta = avg_time * remaining
-            st.info(f"⏱️ ETA: {str(eta).split('.')[0]}")
+    When a placeholder (st.empty()) is given, each call replaces the previous
+    display and redraws are limited to one per min_interval seconds; the final
+    update (current == total) is always drawn. Returns None for skipped updates.
+    start_time is a time.monotonic() reading taken when processing began.
+    """
+    if placeholder is not None:
+        now = time.monotonic()
+        key = id(placeholder)
+        if current < total and now - _last_progress_update.get(key, 0.0) < min_interval:
+            return None
+        if current < total:
+            _last_progress_update[key] = now
+        else:
+            _last_progress_update.pop(key, None)
+        target = placeholder.container()
+    else:
+        target = contextlib.nullcontext()
+    
+    with target:
+        progress_bar = st.progress(current / total if total > 0 else 0)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.success(f"✅ Completed: {current}/{total}")
+        with col2:
+            if current_item:
+                st.info(f"🔄 Processing: {current_item[:50]}...")
+        with col3:
+            if start_time and current > 0:
+                elapsed = time.monotonic() - start_time
+                eta = elapsed / current * (total - current)
+                st.info(f"⏱️ ETA: {format_duration(eta)}")
     
     return progress_bar
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def vector_store_mtime(path="test_store"):
+    """Modification time of the store's index, or None unless both index and docstore exist
+    
+    The one cached store probe shared by every page; cached for a few seconds so
+    reruns do not stat the store on every interaction. Call .clear() after re-indexing.
+    """
+    from vector_store.vector_store import FAISSStore, INDEX_FILE
+    try:
+        if not FAISSStore.exists(path):
+            return None
+        return (Path(path) / INDEX_FILE).stat().st_mtime_ns
+    except (FileNotFoundError, PermissionError):
+        return None
+
+
+def is_vector_store_ready(path="test_store"):
+    """Check that a complete vector store exists, via the shared cached probe"""
+    return vector_store_mtime(path) is not None
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_faiss_store(path, mtime_ns):
+    """Load the vector store once per index version; a re-index changes mtime_ns and reloads it
+    
+    Only the latest version is kept, so the previous index is released after a re-index.
+    """
+    from vector_store.vector_store import FAISSStore
+    return FAISSStore.load(path, mmap=True)
+
+
 def show_vector_store_status():
     """Display vector store status information"""
-    vector_store_exists = Path("test_store/index.faiss").exists() and Path("test_store/docstore.pkl").exists()
+    mtime_ns = vector_store_mtime("test_store")
     
-    if vector_store_exists:
+    if mtime_ns is not None:
         try:
-            from vector_store.vector_store import FAISSStore
-            store = FAISSStore.load("test_store")
-            st.success(f"✅ Vector store ready ({len(store.texts)} documents)")
+            store = _get_faiss_store("test_store", mtime_ns)
+            st.success(f"✅ Vector store ready ({len(store.document_map)} documents)")
             return True
         except:
             st.success("✅ Vector store ready")
@@ -219,8 +366,11 @@ def show_vector_store_status():
 
 def save_uploaded_file_temporarily(uploaded_file):
     """Save uploaded file temporarily and return path"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as temp_file:
-        temp_file.write(uploaded_file.getvalue())
+    suffix = os.path.splitext(uploaded_file.name)[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        # Copy in 1 MB chunks instead of materializing the whole upload a second time
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, temp_file, length=1 << 20)
         return temp_file.name
 
 
@@ -230,6 +380,28 @@ def cleanup_temp_file(file_path):
         os.unlink(file_path)
 
 
+def display_requirements_list(requirements):
+    """Display requirements as collapsible rows in a single HTML block
+    
+    Native <details> elements replace one st.expander per requirement, so the
+    whole list is sent to the frontend as one element however long it is.
+    """
+    buffer = io.StringIO()
+    buffer.write("<div class='requirements-list'>")
+    for i, req in enumerate(requirements, 1):
+        buffer.write(f"<details><summary>Requirement {i}</summary><p>{html.escape(req)}</p></details>")
+    buffer.write("</div>")
+    st.markdown(buffer.getvalue(), unsafe_allow_html=True)
+
+
+def add_display_fields(results):
+    """Precompute the preview header fields once so rendering is plain lookups"""
+    for result in results:
+        requirement = result['requirement']
+        result['_preview'] = requirement[:100] + ('...' if len(requirement) > 100 else '')
+        result['_emoji'] = quality_emoji_for(result.get('quality_score', 0))
+
+
 def display_response_preview(results, max_preview=3):
     """Display preview of generated responses"""
     with st.expander("📋 Preview Generated Responses", expanded=True):
@@ -238,12 +410,14 @@ def display_response_preview(results, max_preview=3):
         for i, result in enumerate(results[:display_count], 1):
             with st.container():
                 # Header with quality indicator
-                quality_emoji = "🌟" if result.get("quality_status") == "Excellent" else "✅" if result.get("quality_status") == "Good" else "⚠️" if result.get("quality_status") == "Needs Review" else "❌"
+                if '_preview' not in result:
+                    add_display_fields([result])
+                quality_emoji = result['_emoji']
                 quality_score = result.get("quality_score", 0)
                 
                 col1, col2 = st.columns([4, 1])
                 with col1:
-                    st.markdown(f"**{i}. {result['requirement'][:100]}{'...' if len(result['requirement']) > 100 else ''}**")
+                    st.markdown(f"**{i}. {result['_preview']}**")
                 with col2:
                     st.markdown(f"{quality_emoji} **{quality_score:.0f}/100**")
                 
@@ -257,8 +431,13 @@ def display_response_preview(results, max_preview=3):
             st.info(f"📊 Showing first {max_preview} of {len(results)} responses. Download the complete results to see all responses.")
             
             # Show summary statistics
-            avg_response_length = sum(len(r['response']) for r in results) / len(results)
-            successful_responses = sum(1 for r in results if r['status'] == 'success')
+            # Reuse the session's responses frame when previewing the stored responses
+            if results is st.session_state.get('responses'):
+                responses_df = get_responses_frame()
+            else:
+                responses_df = pd.DataFrame(results)
+            avg_response_length = responses_df['response'].str.len().mean()
+            successful_responses = int((responses_df['status'] == 'success').sum())
             
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -269,6 +448,25 @@ def display_response_preview(results, max_preview=3):
                 st.metric("Avg Response Length", f"{int(avg_response_length)} chars")
 
 
+def mark_responses_changed():
+    """Bump the responses version; call after st.session_state.responses is set or extended"""
+    st.session_state.responses_version = st.session_state.get('responses_version', 0) + 1
+
+
+def get_responses_frame():
+    """DataFrame view of st.session_state.responses, rebuilt only when the responses change
+    
+    The frame is keyed on st.session_state.responses_version, which every writer of
+    the responses bumps through mark_responses_changed(), so a rerun costs one lookup.
+    """
+    version = st.session_state.get('responses_version', 0)
+    responses_df = st.session_state.get('responses_df')
+    if responses_df is None or st.session_state.get('responses_df_version') != version:
+        responses_df = st.session_state.responses_df = pd.DataFrame(st.session_state.responses)
+        st.session_state.responses_df_version = version
+    return responses_df
+
+
 def display_sidebar_status():
     """Display sidebar status information"""
     with st.sidebar:
@@ -291,13 +489,17 @@ def display_sidebar_status():
             st.success(f"✅ {len(st.session_state.responses)} responses generated")
             
             # Quality Summary
-            quality_scores = [resp.get("quality_score", 0) for resp in st.session_state.responses if resp.get("quality_score")]
-            if quality_scores:
-                avg_quality = sum(quality_scores) / len(quality_scores)
-                status_counts = {}
-                for resp in st.session_state.responses:
-                    status = resp.get("quality_status", "Unknown")
-                    status_counts[status] = status_counts.get(status, 0) + 1
+            responses_df = get_responses_frame()
+            quality_scores = responses_df.get("quality_score", pd.Series(dtype=float)).fillna(0)
+            quality_scores = quality_scores[quality_scores != 0]
+            if len(quality_scores):
+                avg_quality = quality_scores.mean()
+                status_counts = (
+                    responses_df.get("quality_status", pd.Series(index=responses_df.index, dtype=object))
+                    .fillna("Unknown")
+                    .value_counts()
+                    .to_dict()
+                )
                 
                 # Quality overview
                 st.metric("📊 Avg Quality", f"{avg_quality:.1f}/100")
@@ -316,7 +518,7 @@ def display_sidebar_status():
         if st.button("🗑️ Clear All Data"):
             # Clear all session state
             for key in list(st.session_state.keys()):
-                if key in ['requirements', 'responses', 'vector_store_ready', 'extraction_metadata', 'validation_result', 'temp_file_path']:
+                if key in ['requirements', 'responses', 'vector_store_ready', 'extraction_metadata', 'validation_result', 'temp_file_path', 'responses_df']:
                     del st.session_state[key]
             st.success("All data cleared!")
             st.experimental_rerun()
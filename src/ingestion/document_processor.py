@@ -1,41 +1,29 @@
 from typing import List
-import PyPDF2
-import docx
+from .docx_text import iter_docx_paragraph_texts
+from .pdf_text import extract_pdf_page_texts
 
 def process_document(file_path: str, chunk_size: int = 800, chunk_overlap: int = 100) -> List[str]:
     """
     Extracts text from a PDF or DOCX file and splits it into overlapping chunks.
     """
-    # Extract all text from the document
-    full_text = ""
+    # Extract all text from the document, collecting parts and joining once
     if file_path.endswith('.pdf'):
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    full_text += page_text + "\n"
+        text_parts = extract_pdf_page_texts(file_path)
     elif file_path.endswith('.docx'):
-        doc = docx.Document(file_path)
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                full_text += paragraph.text.strip() + "\n"
+        text_parts = list(iter_docx_paragraph_texts(file_path))
     else:
         raise ValueError("Unsupported file format. Please provide a PDF or DOCX file.")
+    full_text = "\n".join(text_parts)
 
     # Split text into paragraphs
     paragraphs = [p.strip() for p in full_text.split('\n') if p.strip()]
 
-    # Further split paragraphs into overlapping chunks
+    # Further split paragraphs into overlapping chunks. Chunk starts advance by
+    # chunk_size - chunk_overlap and stop once a chunk reaches the paragraph end.
+    step = chunk_size - chunk_overlap
     chunks = []
     for para in paragraphs:
-        start = 0
-        while start < len(para):
-            end = min(start + chunk_size, len(para))
-            chunk = para[start:end]
-            chunks.append(chunk)
-            if end == len(para):
-                break
-            start += chunk_size - chunk_overlap
+        last_start = max(len(para) - chunk_overlap, 1)
+        chunks.extend(para[start:start + chunk_size] for start in range(0, last_start, step))
 
     return chunks
\ No newline at end of file
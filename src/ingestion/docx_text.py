@@ -0,0 +1,18 @@
+from typing import BinaryIO, Iterator, Union
+import docx
+from docx.oxml.ns import qn
+
+W_P = qn('w:p')
+
+
+def iter_docx_paragraph_texts(source: Union[str, BinaryIO]) -> Iterator[str]:
+    """Yield the stripped text of each non-empty body paragraph of a DOCX file path or binary file object
+
+    Walks the body's w:p elements directly rather than doc.paragraphs, which
+    wraps every paragraph in a Paragraph object before reading its text.
+    """
+    doc = docx.Document(source)
+    for paragraph in doc.element.body.iterchildren(W_P):
+        text = paragraph.text.strip()
+        if text:
+            yield text
@@ -1,6 +1,28 @@
+import os
+from functools import lru_cache
 import pandas as pd
 
+try:
+    import python_calamine  # noqa: F401
+    # Rust-backed reader; much faster than openpyxl's pure-Python XML parsing
+    EXCEL_ENGINE = 'calamine'
+except ImportError:  # optional: fall back to pandas' default engine
+    EXCEL_ENGINE = None
+
+@lru_cache(maxsize=32)
+def _read_excel(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a workbook; cached per file version, so an edited file is read again"""
+    if EXCEL_ENGINE is not None:
+        try:
+            return pd.read_excel(file_path, engine=EXCEL_ENGINE)
+        except ValueError:
+            # pandas too old to know the calamine engine
+            pass
+    return pd.read_excel(file_path)
+
 def load_excel(file_path: str) -> pd.DataFrame:
     """Load data from an Excel file and return it as a DataFrame."""
-    df = pd.read_excel(file_path)
-    return df
\ No newline at end of file
+    stat = os.stat(file_path)
+    # Hand out a copy so callers cannot modify the cached frame
+    df = _read_excel(file_path, stat.st_mtime_ns, stat.st_size).copy()
+    return df
@@ -0,0 +1,122 @@
+import mmap
+import multiprocessing
+import os
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterator, List, Optional, Union
+import PyPDF2
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional: PDFium's C text extraction is much faster than PyPDF2
+    pdfium = None
+
+# PDFs with fewer pages than this are extracted in-process; below it the cost of
+# starting workers and re-opening the file in each one outweighs the parallel speedup
+PARALLEL_MIN_PAGES = 32
+# Upper bound on extraction processes; each one re-opens and parses the whole file
+MAX_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@contextmanager
+def _open_pdf_file(file_path: str):
+    """Open a PDF file for PyPDF2 as a read-only memory map
+    
+    PyPDF2 seeks around the file and reads many small pieces; serving those from
+    the page cache through a mapping avoids copying them via a read buffer. The
+    file is opened unbuffered since it is only needed for its descriptor.
+    """
+    with open(file_path, 'rb', buffering=0) as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; let PyPDF2 report them
+            yield file
+            return
+        with mapped:
+            if hasattr(mmap, 'MADV_WILLNEED'):
+                # The parser touches most of the file, so ask the kernel to read it all ahead
+                mapped.madvise(mmap.MADV_WILLNEED)
+            yield mapped
+
+
+def iter_pdf_page_texts(source: Union[str, BinaryIO], pages: Optional[range] = None) -> Iterator[str]:
+    """Yield the text of each page of a PDF file path or binary file object
+
+    Uses pypdfium2 when it is installed and falls back to PyPDF2 otherwise.
+    Pages without any extractable text are skipped. `pages` limits extraction
+    to a range of page indices.
+    """
+    if pdfium is None:
+        if isinstance(source, str):
+            with _open_pdf_file(source) as file:
+                yield from iter_pdf_page_texts(file, pages)
+            return
+        reader = PyPDF2.PdfReader(source)
+        for index in pages if pages is not None else range(len(reader.pages)):
+            page_text = reader.pages[index].extract_text()
+            if page_text:
+                yield page_text
+        return
+
+    # PDFium opens paths itself and reads the file natively, with no Python-side copy
+    pdf = pdfium.PdfDocument(source)
+    try:
+        for index in pages if pages is not None else range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                page_text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            if page_text:
+                # PDFium separates lines with CRLF
+                yield page_text.replace('\r\n', '\n')
+    finally:
+        pdf.close()
+
+
+def _count_pdf_pages(file_path: str) -> int:
+    """Return the number of pages in a PDF file"""
+    if pdfium is None:
+        with _open_pdf_file(file_path) as file:
+            return len(PyPDF2.PdfReader(file).pages)
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract the texts of pages [start, stop) of a PDF file"""
+    return list(iter_pdf_page_texts(file_path, range(start, stop)))
+
+
+def extract_pdf_page_texts(file_path: str, max_workers: Optional[int] = None) -> List[str]:
+    """Extract the text of every page of a PDF file, in page order
+
+    Page text extraction is CPU-bound and neither PyPDF2 nor PDFium can be
+    shared across threads, so large PDFs are split into contiguous page ranges
+    that separate worker processes extract in parallel. Small PDFs, and machines
+    with a single core, use iter_pdf_page_texts directly. Workers are spawned
+    rather than forked, since the caller may be a multithreaded app server
+    holding torch and FAISS state.
+    """
+    workers = min(max_workers or MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+    page_count = _count_pdf_pages(file_path) if workers > 1 else 0
+    if page_count < PARALLEL_MIN_PAGES:
+        return list(iter_pdf_page_texts(file_path))
+
+    workers = min(workers, page_count)
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        chunks = executor.map(
+            _extract_page_range,
+            [file_path] * len(starts),
+            starts,
+            [min(start + step, page_count) for start in starts]
+        )
+        return [page_text for chunk in chunks for page_text in chunk]
@@ -1,7 +1,27 @@
+import io
 import re
-from typing import List, Dict, Any
-import PyPDF2
+from typing import List, Dict, Any, BinaryIO, Iterable, Iterator, Optional, Union
 import pandas as pd
+from .docx_text import iter_docx_paragraph_texts
+from .pdf_text import extract_pdf_page_texts, iter_pdf_page_texts
+
+# Line prefixes that open a new numbered question, as one alternation
+_QUESTION_START_RE = re.compile(
+    r'(?:'
+    r'\d+[.)]'          # 1., 2., 1), 2), etc.
+    r'|[A-Z]\d+:'       # G1:, A1:, B2:, etc.
+    r'|Question\s+\d+'  # Question 1, Question 2, etc.
+    r'|Q\d+'            # Q1, Q2, etc.
+    r'|\(\d+\)'         # (1), (2), etc.
+    r')'
+)
+
+# Words that mark a cell as a question or as business content when scoring unnamed columns
+_QUESTION_WORDS_RE = re.compile(r'what|how|describe|explain|provide|please')
+_BUSINESS_TERMS_RE = re.compile(r'experience|approach|company|service|support')
+
+# Cell values that are column headers rather than requirements
+_HEADER_WORDS = frozenset(['id', 'number', 'index', 'row', 'column', 'header', 'title', 'name'])
 
 class RequirementExtractor:
     """Extract requirements from PDF, CSV, or XLSX documents"""
@@ -13,6 +33,8 @@ class RequirementExtractor:
             'item', 'items', 'description', 'task', 'tasks', 'deliverable', 'deliverables',
             'specification', 'specifications', 'criteria', 'criterion', 'objective', 'objectives'
         ]
+        # Set for exact name lookups; the list keeps the order used to rank partial matches
+        self._requirement_name_set = frozenset(self.requirement_column_names)
     
     def extract_from_file(self, file_path: str) -> List[str]:
         """Extract requirements from PDF, CSV, or XLSX files"""
@@ -27,6 +49,50 @@ class RequirementExtractor:
         else:
             raise ValueError("Unsupported file format. Please provide a PDF, XLSX, XLS, or CSV file.")
     
+    def extract_from_bytes(self, data: bytes, suffix: str) -> List[str]:
+        """Extract requirements from in-memory file contents (e.g. a Streamlit upload)
+        
+        suffix is the file extension, with or without the leading dot.
+        """
+        return list(self.iter_from_bytes(data, suffix))
+    
+    def iter_from_bytes(self, data: bytes, suffix: str) -> Iterator[str]:
+        """Yield requirements from in-memory file contents as they are parsed
+        
+        PDF questions are produced page by page, so callers can report progress
+        or start processing before the whole document has been read.
+        """
+        file_type = suffix.lower().lstrip('.')
+        source = io.BytesIO(data)
+        
+        if file_type == 'pdf':
+            yield from self._iter_numbered_questions(self._iter_pdf_lines(source))
+        elif file_type == 'docx':
+            yield from self._iter_numbered_questions(self._extract_text_from_docx(source).split('\n'))
+        elif file_type in ('xlsx', 'xls'):
+            try:
+                df = pd.read_excel(source)
+            except Exception as e:
+                raise ValueError(f"Error reading Excel file: {str(e)}")
+            yield from self._extract_from_dataframe(df)
+        elif file_type == 'csv':
+            try:
+                df = pd.read_csv(source)
+            except Exception as e:
+                raise ValueError(f"Error reading CSV file: {str(e)}")
+            yield from self._extract_from_dataframe(df)
+        else:
+            raise ValueError("Unsupported file format. Please provide a PDF, DOCX, XLSX, XLS, or CSV file.")
+    
+    def extract_text_from_bytes(self, data: bytes, suffix: str) -> str:
+        """Raw text of an in-memory PDF or DOCX file"""
+        file_type = suffix.lower().lstrip('.')
+        if file_type == 'pdf':
+            return self._extract_text_from_pdf(io.BytesIO(data))
+        elif file_type == 'docx':
+            return self._extract_text_from_docx(io.BytesIO(data))
+        raise ValueError("Only PDF and DOCX files have raw text")
+    
     def extract_with_metadata(self, file_path: str) -> Dict[str, Any]:
         """Extract requirements with metadata for structured processing"""
         file_path_lower = file_path.lower()
@@ -85,10 +151,9 @@ class RequirementExtractor:
             column_name = self._find_requirements_column(df)
             
             if column_name:
-                # Extract requirements from the identified column
-                requirements = df[column_name].dropna().astype(str).tolist()
-                # Clean up requirements
-                requirements = [req.strip() for req in requirements if req.strip() and len(req.strip()) > 5]
+                # Extract requirements from the identified column, stripping each value once
+                stripped = (req.strip() for req in df[column_name].dropna().astype(str))
+                requirements = [req for req in stripped if len(req) > 5]
                 
                 return {
                     'requirements': requirements,
@@ -98,8 +163,8 @@ class RequirementExtractor:
                     'dataframe': df  # Include for response generation
                 }
             else:
-                # Fallback: extract from all text columns
-                requirements = self._extract_from_dataframe(df)
+                # Fallback: extract from all text columns; detection already found nothing
+                requirements = self._extract_from_known_column(df, None)
                 return {
                     'requirements': requirements,
                     'source_type': 'excel' if file_path.lower().endswith(('.xlsx', '.xls')) else 'csv',
@@ -111,47 +176,42 @@ class RequirementExtractor:
     
     def _extract_from_dataframe(self, df: pd.DataFrame) -> List[str]:
         """Extract requirements from any columns in a dataframe"""
-        requirements = []
-        
         # First, try to find a requirements column
-        column_name = self._find_requirements_column(df)
-        
+        return self._extract_from_known_column(df, self._find_requirements_column(df))
+    
+    def _extract_from_known_column(self, df: pd.DataFrame, column_name: Optional[str]) -> List[str]:
+        """Extract requirements from an already detected column, or from all text columns when it is None"""
         if column_name:
             # Extract from the specific column
-            requirements = df[column_name].dropna().astype(str).tolist()
+            columns = [column_name]
         else:
             # Extract from all text columns
-            for column in df.columns:
-                if df[column].dtype == 'object':  # Text columns
-                    column_requirements = df[column].dropna().astype(str).tolist()
-                    requirements.extend(column_requirements)
+            columns = [column for column in df.columns if df[column].dtype == 'object']
         
-        # Clean up requirements
+        # Clean up requirements in the same pass that reads them
         cleaned_requirements = []
-        for req in requirements:
-            req = req.strip()
-            if len(req) > 5 and not self._is_header_like(req):
-                cleaned_requirements.append(req)
+        for column in columns:
+            for req in df[column].dropna().astype(str):
+                req = req.strip()
+                if len(req) > 5 and not self._is_header_like(req):
+                    cleaned_requirements.append(req)
         
         return cleaned_requirements
     
     def _find_requirements_column(self, df: pd.DataFrame) -> str:
         """Find the column that likely contains requirements"""
         # Check column names (case-insensitive) - prioritize exact matches first
-        exact_matches = []
-        partial_matches = []
+        col_names = [(col, str(col).lower().strip()) for col in df.columns]
+        for col, col_lower in col_names:
+            if col_lower in self._requirement_name_set:
+                return col
         
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
-            for req_name in self.requirement_column_names:
-                if req_name == col_lower:
-                    exact_matches.append((col, req_name))
-                elif req_name in col_lower:
-                    partial_matches.append((col, req_name))
-        
-        # Prefer exact matches
-        if exact_matches:
-            return exact_matches[0][0]
+        partial_matches = [
+            (col, req_name)
+            for col, col_lower in col_names
+            for req_name in self.requirement_column_names
+            if req_name in col_lower
+        ]
         
         # Then prefer longer partial matches (more specific)
         if partial_matches:
@@ -165,7 +225,8 @@ class RequirementExtractor:
         
         for col in df.columns:
             if df[col].dtype == 'object':  # Text columns
-                sample_values = df[col].dropna().head(10).astype(str)
+                # Only ten cells are scored, so a plain loop beats vectorized .str calls
+                sample_values = df[col].dropna().head(10).astype(str).tolist()
                 if len(sample_values) == 0:
                     continue
                 
@@ -177,10 +238,10 @@ class RequirementExtractor:
                     if '?' in val:
                         score += 3
                     # Question words
-                    if any(word in val_lower for word in ['what', 'how', 'describe', 'explain', 'provide', 'please']):
+                    if _QUESTION_WORDS_RE.search(val_lower):
                         score += 2
                     # Business terms
-                    if any(word in val_lower for word in ['experience', 'approach', 'company', 'service', 'support']):
+                    if _BUSINESS_TERMS_RE.search(val_lower):
                         score += 1
                     # Length check (requirements are usually substantial)
                     if len(val) > 20:
@@ -207,33 +268,40 @@ class RequirementExtractor:
             return True
         
         # Common header words
-        header_words = ['id', 'number', 'index', 'row', 'column', 'header', 'title', 'name']
-        if any(word == text_lower for word in header_words):
+        if text_lower in _HEADER_WORDS:
             return True
         
         return False
     
-    def _extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text content from PDF file"""
-        if not file_path.endswith('.pdf'):
-            raise ValueError("Only PDF files are supported for this simple extractor")
-        
-        full_text = ""
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    full_text += page_text + "\n"
+    def _extract_text_from_pdf(self, source: Union[str, BinaryIO]) -> str:
+        """Extract text content from a PDF file path or binary file object"""
+        if isinstance(source, str):
+            if not source.endswith('.pdf'):
+                raise ValueError("Only PDF files are supported for this simple extractor")
+            # Files on disk can be split across worker processes by page range
+            page_texts = extract_pdf_page_texts(source)
+        else:
+            page_texts = iter_pdf_page_texts(source)
         
-        return full_text
+        return "".join(page_text + "\n" for page_text in page_texts)
+    
+    def _iter_pdf_lines(self, source: BinaryIO) -> Iterator[str]:
+        """Yield the text lines of a PDF one page at a time"""
+        for page_text in iter_pdf_page_texts(source):
+            yield from page_text.split('\n')
+    
+    def _extract_text_from_docx(self, source: Union[str, BinaryIO]) -> str:
+        """Extract paragraph text from a DOCX file path or binary file object"""
+        return "\n".join(iter_docx_paragraph_texts(source))
     
     def _extract_numbered_questions(self, text: str) -> List[str]:
         """Extract numbered questions from text"""
-        questions = []
-        lines = text.split('\n')
-        
-        current_question = ""
+        return list(self._iter_numbered_questions(text.split('\n')))
+    
+    def _iter_numbered_questions(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield numbered questions from lines of text as each one is completed"""
+        # Lines of the question being collected, joined once it is complete
+        current_parts: List[str] = []
         
         for line in lines:
             line = line.strip()
@@ -245,47 +313,38 @@ class RequirementExtractor:
             # Check if this line starts a new numbered question
             # Patterns: "1.", "G1:", "A1:", "Question 1:", etc.
             if self._is_question_start(line):
-                # Save previous question if it exists
-                if current_question.strip():
-                    questions.append(current_question.strip())
+                # Emit previous question if it passes the minimum length check
+                question = " ".join(current_parts)
+                if len(question) > 10:
+                    yield question
                 
                 # Start new question
-                current_question = line
+                current_parts = [line]
             else:
                 # Continue current question (multi-line)
-                if current_question:
-                    current_question += " " + line
+                if current_parts:
+                    current_parts.append(line)
         
         # Don't forget the last question
-        if current_question.strip():
-            questions.append(current_question.strip())
-        
-        # Clean up questions
-        cleaned_questions = []
-        for q in questions:
-            if len(q.strip()) > 10:  # Minimum length check
-                cleaned_questions.append(q.strip())
-        
-        return cleaned_questions
+        question = " ".join(current_parts)
+        if len(question) > 10:
+            yield question
     
     def _is_question_start(self, line: str) -> bool:
         """Check if a line starts a new numbered question"""
-        # Simple patterns for numbered questions
-        patterns = [
-            r'^\d+\.',          # 1., 2., 3., etc.
-            r'^[A-Z]\d+:',      # G1:, A1:, B2:, etc.
-            r'^Question\s+\d+', # Question 1, Question 2, etc.
-            r'^Q\d+',           # Q1, Q2, etc.
-            r'^\(\d+\)',        # (1), (2), etc.
-            r'^\d+\)',          # 1), 2), etc.
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, line):
-                return True
-        
-        return False
+        return _QUESTION_START_RE.match(line) is not None
+
 def extract_requirements_from_file(file_path: str) -> List[str]:
     """Convenience function to extract requirements from a file"""
     extractor = RequirementExtractor()
-    return extractor.extract_from_file(file_path)
\ No newline at end of file
+    return extractor.extract_from_file(file_path)
+
+def extract_requirements_from_bytes(data: bytes, suffix: str) -> List[str]:
+    """Convenience function to extract requirements from in-memory file contents"""
+    extractor = RequirementExtractor()
+    return extractor.extract_from_bytes(data, suffix)
+
+def iter_requirements_from_bytes(data: bytes, suffix: str) -> Iterator[str]:
+    """Convenience function to stream requirements from in-memory file contents"""
+    extractor = RequirementExtractor()
+    return extractor.iter_from_bytes(data, suffix)
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+import openpyxl
+from contextlib import closing
+from typing import Any, Iterator, List, Dict, Tuple, Optional
 from pathlib import Path
 import tempfile
 import os
@@ -12,9 +14,48 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from retrieval.embeddings import embed_text
+from retrieval.embeddings import embed_texts, INDEXING_EMBED_WORKERS
 from vector_store.vector_store import FAISSStore
 
+# Common variations for requirement columns, in priority order
+REQUIREMENT_COLUMN_VARIATIONS = (
+    'requirement', 'requirements', 'question', 'questions', 
+    'query', 'queries', 'item', 'items', 'task', 'tasks',
+    'rfp_requirement', 'rfp_question', 'description'
+)
+
+# Common variations for response columns, in priority order
+RESPONSE_COLUMN_VARIATIONS = (
+    'response', 'responses', 'answer', 'answers', 'reply', 'replies',
+    'solution', 'solutions', 'description', 'details', 'content',
+    'rfp_response', 'our_response', 'proposal_response'
+)
+
+def _iter_sheet_rows(file_path: str) -> Iterator[tuple]:
+    """Yield the rows of a workbook's first sheet as value tuples, header row first
+    
+    .xlsx files are streamed with openpyxl in read-only mode, so memory stays flat
+    however many rows the sheet has. Other formats go through pandas.
+    """
+    if file_path.lower().endswith('.xlsx'):
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    else:
+        df = pd.read_excel(file_path, header=None, dtype=object)
+        yield from df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+def _cell_text(row: tuple, index: int) -> str:
+    """Stripped text of a cell, formatted the way pandas would read it; '' when empty"""
+    value: Any = row[index] if index < len(row) else None
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
 class RFPResponseIndexer:
     """
     Handles indexing of RFP response documents to add them to the vector store.
@@ -41,40 +82,27 @@ class RFPResponseIndexer:
         Returns:
             Tuple[Optional[str], Optional[str]]: (requirement_column, response_column)
         """
-        # Common variations for requirement columns
-        requirement_variations = [
-            'requirement', 'requirements', 'question', 'questions', 
-            'query', 'queries', 'item', 'items', 'task', 'tasks',
-            'rfp_requirement', 'rfp_question', 'description'
-        ]
-        
-        # Common variations for response columns
-        response_variations = [
-            'response', 'responses', 'answer', 'answers', 'reply', 'replies',
-            'solution', 'solutions', 'description', 'details', 'content',
-            'rfp_response', 'our_response', 'proposal_response'
-        ]
-        
-        columns_lower = [col.lower().strip() for col in df.columns]
+        # (normalized header, column) pairs; non-string headers such as numbers are matched as text
+        columns = [(str(col).lower().strip(), col) for col in df.columns]
         
-        # Find requirement column
+        # Find requirement column: variations in priority order, each matched as a substring
         requirement_col = None
-        for var in requirement_variations:
-            for i, col in enumerate(columns_lower):
-                if var in col or col in var:
-                    requirement_col = df.columns[i]
+        for var in REQUIREMENT_COLUMN_VARIATIONS:
+            for col_lower, col in columns:
+                if var in col_lower or col_lower in var:
+                    requirement_col = col
                     break
             if requirement_col:
                 break
         
         # Find response column
         response_col = None
-        for var in response_variations:
-            for i, col in enumerate(columns_lower):
-                if var in col or col in var:
+        for var in RESPONSE_COLUMN_VARIATIONS:
+            for col_lower, col in columns:
+                if var in col_lower or col_lower in var:
                     # Make sure it's not the same as requirement column
-                    if df.columns[i] != requirement_col:
-                        response_col = df.columns[i]
+                    if col != requirement_col:
+                        response_col = col
                         break
             if response_col:
                 break
@@ -92,37 +120,36 @@ class RFPResponseIndexer:
             Dict: Processing results with extracted data and metadata
         """
         try:
-            # Load the Excel file
-            df = pd.read_excel(file_path)
-            
-            # Detect columns
-            req_col, resp_col = self.detect_columns(df)
-            
-            if not req_col or not resp_col:
-                return {
-                    'success': False,
-                    'error': 'Could not detect requirement and response columns',
-                    'available_columns': list(df.columns),
-                    'detected_requirement_col': req_col,
-                    'detected_response_col': resp_col
-                }
-            
-            # Filter out empty rows
-            df = df.dropna(subset=[req_col, resp_col])
-            df = df[df[req_col].astype(str).str.strip() != '']
-            df = df[df[resp_col].astype(str).str.strip() != '']
-            
-            # Extract requirement-response pairs
-            rfp_pairs = []
-            for _, row in df.iterrows():
-                requirement = str(row[req_col]).strip()
-                response = str(row[resp_col]).strip()
+            # Stream the sheet; closing() shuts the read-only workbook even if a row fails
+            with closing(_iter_sheet_rows(file_path)) as rows:
+                header = next(rows, ())
+                columns = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+                
+                # Detect columns from the header row alone
+                req_col, resp_col = self.detect_columns(pd.DataFrame(columns=columns))
                 
-                if requirement and response:
-                    rfp_pairs.append({
-                        'requirement': requirement,
-                        'response': response
-                    })
+                if not req_col or not resp_col:
+                    return {
+                        'success': False,
+                        'error': 'Could not detect requirement and response columns',
+                        'available_columns': columns,
+                        'detected_requirement_col': req_col,
+                        'detected_response_col': resp_col
+                    }
+                
+                # Extract requirement-response pairs, skipping rows where either is empty
+                req_index, resp_index = columns.index(req_col), columns.index(resp_col)
+                rfp_pairs = []
+                kept_rows = []
+                for row in rows:
+                    requirement = _cell_text(row, req_index)
+                    response = _cell_text(row, resp_index)
+                    if requirement and response:
+                        rfp_pairs.append({'requirement': requirement, 'response': response})
+                        kept_rows.append(tuple(row[:len(columns)]) + (None,) * (len(columns) - len(row)))
+            
+            # Every column of the sheet, for the rows that produced a pair
+            df = pd.DataFrame(kept_rows, columns=columns)
             
             return {
                 'success': True,
@@ -179,9 +206,6 @@ This is a historical RFP response that demonstrates how our organization has add
             Dict: Results of the indexing operation
         """
         try:
-            # Generate embeddings for documents
-            embeddings = [embed_text(doc) for doc in documents]
-            
             # Load existing vector store or create new one
             vector_store_exists = (Path(self.vector_store_path) / "index.faiss").exists()
             
@@ -189,23 +213,37 @@ This is a historical RFP response that demonstrates how our organization has add
                 # Load existing vector store
                 store = FAISSStore.load(self.vector_store_path)
                 initial_count = len(store.document_map)
+                doc_id_by_text = {text: doc_id for doc_id, text in store.document_map.items()}
             else:
-                # Create new vector store
-                store = FAISSStore()
+                # Created below, once the embedding size is known
+                store = None
                 initial_count = 0
+                doc_id_by_text = {}
             
-            # Add new documents
-            doc_ids = store.add_texts(documents, embeddings)
+            # Documents already stored, or repeated in this batch, would only add identical vectors
+            new_documents = list(dict.fromkeys(doc for doc in documents if doc not in doc_id_by_text))
             
-            # Save updated vector store
-            store.save(self.vector_store_path)
+            if new_documents:
+                # Generate embeddings in batched forward passes -> (n, d) matrix
+                embeddings = embed_texts(new_documents, max_workers=INDEXING_EMBED_WORKERS)
+                if store is None:
+                    # Create new vector store sized to the embedding model
+                    store = FAISSStore(dimension=embeddings.shape[1])
+                
+                # Add new documents
+                doc_id_by_text.update(zip(new_documents, store.add_texts(new_documents, embeddings)))
+                
+                # Save updated vector store
+                store.save(self.vector_store_path)
             
             return {
                 'success': True,
-                'documents_added': len(documents),
-                'document_ids': doc_ids,
+                'documents_added': len(new_documents),
+                'duplicates_skipped': len(documents) - len(new_documents),
+                # One id per input document; duplicates share the id of the stored copy
+                'document_ids': [doc_id_by_text[doc] for doc in documents],
                 'initial_document_count': initial_count,
-                'final_document_count': len(store.document_map),
+                'final_document_count': initial_count + len(new_documents),
                 'vector_store_path': self.vector_store_path,
                 'timestamp': datetime.now().isoformat()
             }
@@ -261,7 +299,7 @@ This is a historical RFP response that demonstrates how our organization has add
                     'path': self.vector_store_path
                 }
             
-            store = FAISSStore.load(self.vector_store_path)
+            store = FAISSStore.load(self.vector_store_path, mmap=True)
             
             return {
                 'exists': True,
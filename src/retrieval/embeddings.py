@@ -1,6 +1,10 @@
 from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
 import os
+import sys
+import numpy as np
+from functools import lru_cache
+from typing import List
 from pathlib import Path
 
 # Get the project root directory
@@ -8,9 +12,71 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 # Load .env file from project root
 load_dotenv(ROOT_DIR / '.env')
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# The app imports this file both as src.retrieval.embeddings (RAG pipeline) and as
+# retrieval.embeddings (indexer). Python treats those as two modules, so without this
+# each would load its own copy of the model weights.
+_MODULE_ALIASES = ('src.retrieval.embeddings', 'retrieval.embeddings')
+
+def _load_model() -> SentenceTransformer:
+    """Return the model already loaded under another import name, or load it"""
+    for name in _MODULE_ALIASES:
+        loaded = getattr(sys.modules.get(name), 'model', None)
+        if loaded is not None:
+            return loaded
+    return SentenceTransformer(MODEL_NAME)
+
+model = _load_model()
+
+# Texts per forward pass when encoding lists
+EMBED_BATCH_SIZE = 64
+# Lists at least this long are split across one encoding process per core on CPU.
+# Below it, starting the workers (each loads its own copy of the model) costs more than it saves
+MULTI_PROCESS_MIN_TEXTS = 256
+# Worker processes used by indexing; each one holds a full copy of the model
+INDEXING_EMBED_WORKERS = min(4, os.cpu_count() or 1)
+# Distinct single texts whose embeddings are kept; RFPs repeat boilerplate requirements
+EMBED_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=EMBED_CACHE_SIZE)
+def _embed_cached(text: str) -> np.ndarray:
+    """Encode one text; read-only so the cached array cannot be changed by callers"""
+    embedding = model.encode(text, normalize_embeddings=True)
+    embedding.setflags(write=False)
+    return embedding
 
 def embed_text(text: str) -> list[float]:
     """Generate embeddings for a given text using a local Hugging Face model."""
-    embedding = model.encode(text)
-    return embedding.tolist()
\ No newline at end of file
+    return _embed_cached(text).tolist()
+
+def embed_texts(texts: List[str], max_workers: int = 1) -> np.ndarray:
+    """Generate embeddings for a list of texts in a single batched forward pass.
+
+    Returns a float32 array of shape (len(texts), dimension) with unit-length rows.
+    With max_workers > 1, large lists are encoded in up to that many worker processes
+    when the model runs on CPU; on a GPU a single batched pass is already the fastest
+    option. Only offline indexing should ask for workers, never the query path.
+    """
+    texts = list(texts)
+    workers = min(max_workers, os.cpu_count() or 1)
+    if len(texts) >= MULTI_PROCESS_MIN_TEXTS and workers > 1 and model.device.type == 'cpu':
+        pool = model.start_multi_process_pool(target_devices=['cpu'] * workers)
+        try:
+            embeddings = model.encode_multi_process(
+                texts,
+                pool,
+                batch_size=EMBED_BATCH_SIZE,
+                normalize_embeddings=True
+            )
+        finally:
+            model.stop_multi_process_pool(pool)
+    else:
+        embeddings = model.encode(
+            texts,
+            batch_size=EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+    return np.asarray(embeddings, dtype=np.float32)
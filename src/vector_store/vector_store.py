@@ -1,9 +1,65 @@
 import faiss
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Union
+import os
 import pickle
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # optional: without it the document map is pickled
+    pa = None
+
+INDEX_FILE = "index.faiss"
+# Columnar (id, text) table; much smaller and faster to read back than a pickled dict
+DOCSTORE_FILE = "docstore.arrow"
+# Pickled document map, written when pyarrow is missing and read from older stores
+PICKLE_DOCSTORE_FILE = "docstore.pkl"
+
+# Stores switch from exact flat search to an HNSW graph once they hold this many vectors;
+# below it a brute-force scan is already fast and exact
+HNSW_MIN_VECTORS = 1000
+# Graph neighbours per node, and candidate list sizes while building and searching
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64
+# OpenMP threads for index.search. Queries arrive a handful at a time, where spreading
+# a search over cores costs more than it saves and contends with torch's thread pool
+SEARCH_OMP_THREADS = 1
+
+@contextmanager
+def _replace_on_success(path: Path):
+    """Yield a temporary path next to `path` and move it over `path` once written
+    
+    os.replace swaps the directory entry atomically, so readers that already
+    opened or memory-mapped the old file keep a consistent copy of it.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+@contextmanager
+def _omp_threads(n: int):
+    """Run the block with the calling thread's OpenMP thread count set to n
+    
+    The count is a per-thread setting, so it is restored afterwards and never
+    leaks into torch or anything else that runs on the same thread.
+    """
+    previous = faiss.omp_get_max_threads()
+    faiss.omp_set_num_threads(n)
+    try:
+        yield
+    finally:
+        faiss.omp_set_num_threads(previous)
+
 class FAISSStore:
     def __init__(self, dimension: int = 1536):
         """Initialize FAISS vector store
@@ -11,24 +67,33 @@ class FAISSStore:
             dimension (int): Dimension of vectors (1536 for OpenAI embeddings)
         """
         self.dimension = dimension
-        self.index = faiss.IndexFlatL2(dimension)
+        # Vectors are L2-normalized on the way in, so inner product is cosine similarity
+        self.index = faiss.IndexFlatIP(dimension)
         self.document_map: Dict[int, str] = {}
         self.current_id = 0
+        # Set for stores loaded with mmap=True, whose index is backed by the saved file
+        self.read_only = False
 
-    def add_texts(self, texts: List[str], embeddings: List[List[float]]) -> List[int]:
+    def add_texts(self, texts: List[str], embeddings: Union[List[List[float]], np.ndarray]) -> List[int]:
         """Add texts and their embeddings to the store
         Args:
             texts (List[str]): List of text chunks
-            embeddings (List[List[float]]): List of embeddings
+            embeddings (List[List[float]] | np.ndarray): List of embeddings or an (n, dimension) matrix
         Returns:
             List[int]: List of document IDs
         """
-        if not texts or not embeddings:
+        if self.read_only:
+            raise ValueError("Vector store was loaded with mmap=True and is read-only")
+        if not texts or len(embeddings) == 0:
             return []
         
-        embeddings_array = np.array(embeddings).astype('float32')
+        embeddings_array = self._normalized(embeddings)
         doc_ids = list(range(self.current_id, self.current_id + len(texts)))
         
+        # Large stores move to an approximate HNSW graph for sublinear search
+        if isinstance(self.index, faiss.IndexFlat) and self.index.ntotal + len(texts) >= HNSW_MIN_VECTORS:
+            self.index = self._to_hnsw(self.index)
+        
         # Add embeddings to FAISS
         self.index.add(embeddings_array)
         
@@ -39,6 +104,37 @@ class FAISSStore:
         self.current_id += len(texts)
         return doc_ids
 
+    @staticmethod
+    def _normalized(vectors) -> np.ndarray:
+        """Return a float32 copy of vectors with every row scaled to unit length"""
+        array = np.array(vectors, dtype=np.float32, order='C', ndmin=2)
+        faiss.normalize_L2(array)
+        return array
+
+    def cosine_similarity(self, score: float) -> float:
+        """Convert a search score from this store's index into cosine similarity
+        
+        Inner-product indexes return it directly; stores built with L2 indexes hold
+        unit-length vectors, for which squared L2 distance d maps to 1 - d/2.
+        """
+        if self.index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            return score
+        return 1 - score / 2
+
+    @staticmethod
+    def _to_hnsw(flat_index) -> "faiss.IndexHNSWFlat":
+        """Copy the vectors of a flat index into an HNSW index with the same metric
+        
+        HNSW assigns ids in insertion order, so existing document ids and scores
+        keep their meaning.
+        """
+        index = faiss.IndexHNSWFlat(flat_index.d, HNSW_M, flat_index.metric_type)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        if flat_index.ntotal:
+            index.add(flat_index.reconstruct_n(0, flat_index.ntotal))
+        return index
+
     def similarity_search(self, query_embedding: List[float], k: int = 5) -> List[Tuple[int, str, float]]:
         """Search for similar vectors
         Args:
@@ -47,8 +143,9 @@ class FAISSStore:
         Returns:
             List[Tuple[int, str, float]]: List of (id, text, score) tuples
         """
-        query_array = np.array([query_embedding]).astype('float32')
-        distances, indices = self.index.search(query_array, k)
+        query_array = self._normalized(query_embedding)
+        with _omp_threads(SEARCH_OMP_THREADS):
+            distances, indices = self.index.search(query_array, k)
         
         results = []
         for idx, distance in zip(indices[0], distances[0]):
@@ -57,32 +154,83 @@ class FAISSStore:
         
         return results
 
+    def similarity_search_batch(self, query_embeddings: np.ndarray, k: int = 5) -> List[List[Tuple[int, str, float]]]:
+        """Search for similar vectors for many queries with a single FAISS call
+        Args:
+            query_embeddings (np.ndarray): Query matrix of shape (nq, dimension)
+            k (int): Number of results to return per query
+        Returns:
+            List[List[Tuple[int, str, float]]]: One list of (id, text, score) tuples per query
+        """
+        query_array = self._normalized(query_embeddings)
+        with _omp_threads(SEARCH_OMP_THREADS):
+            distances, indices = self.index.search(query_array, k)
+
+        batch_results = []
+        for row_indices, row_distances in zip(indices, distances):
+            batch_results.append([
+                (int(idx), self.document_map[int(idx)], float(distance))
+                for idx, distance in zip(row_indices, row_distances)
+                if idx != -1
+            ])
+
+        return batch_results
+
     def save(self, directory: str):
         """Save the vector store to disk
         Args:
             directory (str): Directory to save the store
         """
+        if self.read_only:
+            # Rewriting the file behind a mapped index would corrupt it mid-search
+            raise ValueError("Vector store was loaded with mmap=True and is read-only")
         save_dir = Path(directory)
         save_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save FAISS index
-        faiss.write_index(self.index, str(save_dir / "index.faiss"))
+        # Save FAISS index; written aside and swapped in, since running apps may have it mapped
+        with _replace_on_success(save_dir / INDEX_FILE) as tmp_path:
+            faiss.write_index(self.index, tmp_path)
         
         # Save document map
-        with open(save_dir / "docstore.pkl", "wb") as f:
-            pickle.dump(
+        if pa is not None:
+            table = pa.table(
                 {
-                    "document_map": self.document_map,
-                    "current_id": self.current_id
-                }, 
-                f
+                    "id": pa.array(list(self.document_map), type=pa.int64()),
+                    "text": pa.array(list(self.document_map.values()), type=pa.large_string())
+                },
+                metadata={"current_id": str(self.current_id)}
             )
+            with _replace_on_success(save_dir / DOCSTORE_FILE) as tmp_path:
+                feather.write_feather(table, tmp_path, compression="zstd")
+            # Drop a pickle from an older save so it cannot be read instead
+            (save_dir / PICKLE_DOCSTORE_FILE).unlink(missing_ok=True)
+        else:
+            with _replace_on_success(save_dir / PICKLE_DOCSTORE_FILE) as tmp_path:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(
+                        {
+                            "document_map": self.document_map,
+                            "current_id": self.current_id
+                        }, 
+                        f
+                    )
+            (save_dir / DOCSTORE_FILE).unlink(missing_ok=True)
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        """Check whether a directory holds a saved vector store"""
+        store_dir = Path(directory)
+        return (store_dir / INDEX_FILE).is_file() and (
+            (store_dir / DOCSTORE_FILE).is_file() or (store_dir / PICKLE_DOCSTORE_FILE).is_file()
+        )
 
     @classmethod
-    def load(cls, directory: str) -> "FAISSStore":
+    def load(cls, directory: str, mmap: bool = False) -> "FAISSStore":
         """Load vector store from disk
         Args:
             directory (str): Directory containing the store
+            mmap (bool): Memory-map the index read-only so the OS pages vectors in on demand.
+                The returned store rejects add_texts and save.
         Returns:
             FAISSStore: Loaded vector store
         """
@@ -92,12 +240,35 @@ class FAISSStore:
         store = cls()
         
         # Load FAISS index
-        store.index = faiss.read_index(str(load_dir / "index.faiss"))
+        index_path = str(load_dir / INDEX_FILE)
+        store.index = None
+        if mmap:
+            try:
+                # IO_FLAG_MMAP_IFC maps the file itself; plain IO_FLAG_MMAP still copies
+                # flat and HNSW vectors into RAM
+                store.index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY)
+                store.read_only = True
+            except RuntimeError:
+                # Index type without mmap support; fall back to reading it into RAM
+                store.index = None
+        if store.index is None:
+            store.index = faiss.read_index(index_path)
+        store.dimension = store.index.d
+        if hasattr(store.index, "hnsw"):
+            store.index.hnsw.efSearch = HNSW_EF_SEARCH
         
         # Load document map
-        with open(load_dir / "docstore.pkl", "rb") as f:
-            data = pickle.load(f)
-            store.document_map = data["document_map"]
-            store.current_id = data["current_id"]
+        docstore_path = load_dir / DOCSTORE_FILE
+        if docstore_path.is_file():
+            if pa is None:
+                raise ImportError(f"pyarrow is required to read {docstore_path}")
+            table = feather.read_table(str(docstore_path))
+            store.document_map = dict(zip(table.column("id").to_pylist(), table.column("text").to_pylist()))
+            store.current_id = int(table.schema.metadata[b"current_id"])
+        else:
+            with open(load_dir / PICKLE_DOCSTORE_FILE, "rb") as f:
+                data = pickle.load(f)
+                store.document_map = data["document_map"]
+                store.current_id = data["current_id"]
         
         return store
\ No newline at end of file
@@ -0,0 +1,89 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+import openpyxl
+import pandas as pd
+from src.app.output_generator import OutputGenerator
+
+RESULTS = [
+    {
+        "requirement": "Describe your approach to data security.",
+        "response": "We encrypt all data at rest and in transit.",
+        "status": "success",
+        "quality_score": 82.5,
+        "quality_status": "Good",
+        "quality_breakdown": {"completeness": 80, "clarity": 85, "professionalism": 90, "relevance": 75},
+        "quality_feedback": ["Add certifications", "Mention audits"]
+    },
+    {
+        "requirement": "How do you provide support?",
+        "response": "A 24/7 service desk.",
+        "status": "success"
+    },
+]
+
+def sheet_values(data):
+    worksheet = openpyxl.load_workbook(io.BytesIO(data)).active
+    return [list(row) for row in worksheet.iter_rows(values_only=True)]
+
+class TestOutputGenerator(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = OutputGenerator()
+
+    def test_results_to_dataframe_fills_missing_quality_columns(self):
+        df = OutputGenerator.results_to_dataframe(RESULTS)
+        self.assertEqual(list(df.columns[:4]), ["ID", "Requirement", "Response", "Status"])
+        self.assertEqual(df.loc[0, "Quality Feedback"], "Add certifications; Mention audits")
+        self.assertTrue(df.loc[1, ["Quality Score", "Quality Status"]].isna().all())
+        self.assertEqual(list(OutputGenerator.results_to_dataframe(RESULTS[1:]).columns),
+                         ["ID", "Requirement", "Response", "Status"])
+
+    def test_excel_bytes_streams_every_row(self):
+        rows = sheet_values(self.generator.generate_excel_bytes(RESULTS))
+        self.assertEqual(rows[0][:4], ["ID", "Requirement", "Response", "Status"])
+        self.assertEqual(rows[1][:5], [1, RESULTS[0]["requirement"], RESULTS[0]["response"], "success", 82.5])
+        # Missing quality values are written as empty cells, not "nan"
+        self.assertEqual(rows[2], [2, RESULTS[1]["requirement"], RESULTS[1]["response"], "success"] + [None] * 7)
+
+    def test_excel_bytes_wraps_requirement_and_response(self):
+        worksheet = openpyxl.load_workbook(io.BytesIO(self.generator.generate_excel_bytes(RESULTS))).active
+        self.assertTrue(worksheet["B2"].alignment.wrap_text)
+        self.assertTrue(worksheet["C2"].alignment.wrap_text)
+        self.assertFalse(worksheet["D2"].alignment.wrap_text)
+        self.assertEqual(worksheet.column_dimensions["A"].width, 5)
+
+    def test_excel_bytes_accepts_the_export_dataframe(self):
+        df = OutputGenerator.results_to_dataframe(RESULTS)
+        self.assertEqual(sheet_values(self.generator.generate_excel_bytes(df)),
+                         sheet_values(self.generator.generate_excel_bytes(RESULTS)))
+
+    def test_streaming_excel_file_matches_bytes(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.generator.output_dir = Path(output_dir)
+            path = self.generator.generate_excel(RESULTS, "out.xlsx", streaming=True)
+            self.assertEqual(sheet_values(Path(path).read_bytes()),
+                             sheet_values(self.generator.generate_excel_bytes(RESULTS)))
+
+    def test_csv_bytes_accepts_the_export_dataframe(self):
+        df = OutputGenerator.results_to_dataframe(RESULTS)
+        csv_bytes = self.generator.generate_csv_bytes(df)
+        self.assertEqual(csv_bytes, self.generator.generate_csv_bytes(RESULTS))
+        self.assertTrue(csv_bytes.startswith(b"ID,Requirement,Response,Status"))
+        self.assertEqual(len(pd.read_csv(io.BytesIO(csv_bytes))), len(RESULTS))
+
+    def test_structured_excel_keeps_original_columns(self):
+        original_df = pd.DataFrame({
+            "ID": [1, 2, 3],
+            "Question": [RESULTS[0]["requirement"], RESULTS[1]["requirement"], "Unanswered question"],
+            "Notes": ["a", None, "c"]
+        })
+        rows = sheet_values(self.generator.generate_structured_excel_bytes(RESULTS, original_df, "Question"))
+        self.assertEqual(rows[0], ["ID", "Question", "Notes", "Response", "Status"])
+        self.assertEqual(rows[1], [1, RESULTS[0]["requirement"], "a", RESULTS[0]["response"], "success"])
+        self.assertEqual(rows[2], [2, RESULTS[1]["requirement"], None, RESULTS[1]["response"], "success"])
+        self.assertEqual(rows[3], [3, "Unanswered question", "c", "No response generated", "unknown"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from reportlab.pdfgen import canvas
+from src.ingestion import pdf_text
+from src.ingestion.pdf_text import PARALLEL_MIN_PAGES, extract_pdf_page_texts, iter_pdf_page_texts
+
+def write_pdf(path, page_count):
+    pdf = canvas.Canvas(path)
+    for number in range(page_count):
+        # Every third page is left blank to check that empty pages are skipped
+        if number % 3 != 2:
+            pdf.drawString(72, 800, f"Page {number}")
+        pdf.showPage()
+    pdf.save()
+
+class TestPdfText(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.pdf_path = os.path.join(cls.tmp_dir.name, "pages.pdf")
+        cls.page_count = PARALLEL_MIN_PAGES + 4
+        write_pdf(cls.pdf_path, cls.page_count)
+        cls.expected = [f"Page {number}" for number in range(cls.page_count) if number % 3 != 2]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def assertPageTexts(self, page_texts, expected):
+        self.assertEqual([text.strip() for text in page_texts], expected)
+
+    def test_page_range_limits_extraction(self):
+        self.assertPageTexts(iter_pdf_page_texts(self.pdf_path, range(3, 6)), ["Page 3", "Page 4"])
+
+    def test_page_range_with_pypdf2_fallback(self):
+        with mock.patch.object(pdf_text, "pdfium", None):
+            self.assertPageTexts(iter_pdf_page_texts(self.pdf_path, range(3, 6)), ["Page 3", "Page 4"])
+            with open(self.pdf_path, "rb") as file:
+                self.assertPageTexts(iter_pdf_page_texts(file, range(0, 2)), ["Page 0", "Page 1"])
+
+    def test_parallel_extraction_keeps_page_order(self):
+        with mock.patch("os.cpu_count", return_value=3):
+            self.assertPageTexts(extract_pdf_page_texts(self.pdf_path, max_workers=3), self.expected)
+
+    def test_single_worker_reads_in_process(self):
+        with mock.patch.object(pdf_text, "ProcessPoolExecutor") as pool:
+            self.assertPageTexts(extract_pdf_page_texts(self.pdf_path, max_workers=1), self.expected)
+        pool.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+from src.app.quality_scorer import RFPQualityScorer
+
+SECURITY = ("Describe your approach to data security.",
+            "We provide encryption at rest and in transit, following industry best practices.")
+SUPPORT = ("How do you provide support?", "maybe email")
+
+class TestScoreBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.scorer = RFPQualityScorer()
+
+    def test_scores_each_distinct_pair_once(self):
+        pairs = [SECURITY, SUPPORT, SECURITY, SECURITY, SUPPORT]
+        with mock.patch.object(self.scorer, "score_response", wraps=self.scorer.score_response) as score_response:
+            scores = self.scorer.score_batch(pairs)
+        self.assertEqual(score_response.call_count, 2)
+        self.assertEqual(len(scores), len(pairs))
+
+    def test_results_follow_input_order(self):
+        pairs = [SUPPORT, SECURITY, SUPPORT]
+        scores = self.scorer.score_batch(pairs)
+        self.assertEqual(scores, [self.scorer.score_response(*pair) for pair in pairs])
+        self.assertNotEqual(scores[0], scores[1])
+
+    def test_repeated_pairs_get_independent_copies(self):
+        first, second = self.scorer.score_batch([SUPPORT, SUPPORT])
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.feedback, second.feedback)
+        second.feedback.append("edited")
+        second.overall_score = 0
+        self.assertNotIn("edited", first.feedback)
+        self.assertNotEqual(first.overall_score, 0)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.scorer.score_batch([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
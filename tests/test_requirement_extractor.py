@@ -0,0 +1,80 @@
+import io
+import types
+import unittest
+import docx
+import pandas as pd
+from reportlab.pdfgen import canvas
+from src.ingestion.requirement_extractor import RequirementExtractor, iter_requirements_from_bytes
+
+QUESTIONS = [
+    "1. Describe your approach to data security.",
+    "2. How do you provide 24/7 support?",
+]
+
+def docx_bytes(paragraphs):
+    document = docx.Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+def pdf_bytes(pages):
+    output = io.BytesIO()
+    pdf = canvas.Canvas(output)
+    for lines in pages:
+        y = 800
+        for line in lines:
+            pdf.drawString(72, y, line)
+            y -= 20
+        pdf.showPage()
+    pdf.save()
+    return output.getvalue()
+
+class TestIterFromBytes(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = RequirementExtractor()
+
+    def test_returns_a_generator(self):
+        requirements = self.extractor.iter_from_bytes(docx_bytes(QUESTIONS), "docx")
+        self.assertIsInstance(requirements, types.GeneratorType)
+        self.assertEqual(list(requirements), QUESTIONS)
+
+    def test_docx_joins_continuation_lines(self):
+        data = docx_bytes([
+            "Introduction text before the first question",
+            QUESTIONS[0],
+            "Include encryption at rest.",
+            "",
+            QUESTIONS[1],
+        ])
+        self.assertEqual(
+            list(self.extractor.iter_from_bytes(data, ".DOCX")),
+            [QUESTIONS[0] + " Include encryption at rest.", QUESTIONS[1]]
+        )
+
+    def test_pdf_questions_span_pages(self):
+        data = pdf_bytes([[QUESTIONS[0], "Include encryption at rest."], [QUESTIONS[1]]])
+        self.assertEqual(
+            list(self.extractor.iter_from_bytes(data, "pdf")),
+            [QUESTIONS[0] + " Include encryption at rest.", QUESTIONS[1]]
+        )
+
+    def test_csv_and_xlsx_use_the_requirement_column(self):
+        df = pd.DataFrame({"ID": [1, 2], "Requirement": QUESTIONS, "Notes": ["n/a", "n/a"]})
+        xlsx = io.BytesIO()
+        df.to_excel(xlsx, index=False)
+        self.assertEqual(list(self.extractor.iter_from_bytes(df.to_csv(index=False).encode(), "csv")), QUESTIONS)
+        self.assertEqual(list(self.extractor.iter_from_bytes(xlsx.getvalue(), "xlsx")), QUESTIONS)
+
+    def test_matches_extract_from_bytes(self):
+        data = docx_bytes(QUESTIONS)
+        self.assertEqual(list(iter_requirements_from_bytes(data, "docx")), self.extractor.extract_from_bytes(data, "docx"))
+
+    def test_unsupported_suffix_raises(self):
+        with self.assertRaises(ValueError):
+            list(self.extractor.iter_from_bytes(b"text", "txt"))
+
+if __name__ == '__main__':
+    unittest.main()
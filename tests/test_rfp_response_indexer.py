@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from src.ingestion import rfp_response_indexer
+from src.ingestion.rfp_response_indexer import RFPResponseIndexer
+from src.vector_store.vector_store import FAISSStore
+
+def fake_embed_texts(texts, max_workers=1):
+    """Deterministic stand-in embeddings, one row per text"""
+    return np.stack([
+        np.random.default_rng(sum(text.encode())).standard_normal(8).astype(np.float32)
+        for text in texts
+    ])
+
+class TestDetectColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.indexer = RFPResponseIndexer()
+
+    def detect(self, *columns):
+        return self.indexer.detect_columns(pd.DataFrame(columns=list(columns)))
+
+    def test_detects_plain_headers(self):
+        self.assertEqual(self.detect("Requirement", "Response"), ("Requirement", "Response"))
+
+    def test_first_column_matching_a_variation_wins(self):
+        # Variations are tried in priority order and each is matched as a substring,
+        # so an earlier partial match beats a later exact one
+        self.assertEqual(self.detect("Requirement ID", "Question", "Answer"), ("Requirement ID", "Answer"))
+        self.assertEqual(self.detect("Requirement ID", "Requirement", "Answer"), ("Requirement ID", "Answer"))
+
+    def test_higher_priority_variation_beats_column_order(self):
+        self.assertEqual(self.detect("Question", "Requirement", "Answer", "Response"), ("Requirement", "Response"))
+
+    def test_response_never_reuses_requirement_column(self):
+        self.assertEqual(self.detect("Description", "Details"), ("Description", "Details"))
+
+class TestProcessRfpResponses(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.indexer = RFPResponseIndexer(os.path.join(self.tmp_dir.name, "store"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_xlsx(self, df):
+        path = os.path.join(self.tmp_dir.name, "responses.xlsx")
+        df.to_excel(path, index=False)
+        return path
+
+    def test_streams_pairs_and_keeps_every_column(self):
+        path = self.write_xlsx(pd.DataFrame({
+            "ID": [1, 2, 3, 4],
+            "Requirement": ["  Describe security ", None, "Support hours", 2024.0],
+            "Response": ["Encrypted", "Orphan response", "   ", "Yes"],
+            "Owner": ["Ana", "Ben", "Cy", None]
+        }))
+        result = self.indexer.process_rfp_responses(path)
+
+        self.assertTrue(result["success"])
+        self.assertEqual((result["requirement_column"], result["response_column"]), ("Requirement", "Response"))
+        # Rows with an empty requirement or response are skipped; whole-number cells read as integers
+        self.assertEqual(result["rfp_pairs"], [
+            {"requirement": "Describe security", "response": "Encrypted"},
+            {"requirement": "2024", "response": "Yes"},
+        ])
+        self.assertEqual(result["total_pairs"], 2)
+        self.assertEqual(list(result["dataframe"].columns), ["ID", "Requirement", "Response", "Owner"])
+        self.assertEqual(result["dataframe"]["ID"].tolist(), [1, 4])
+
+    def test_reports_columns_when_detection_fails(self):
+        path = self.write_xlsx(pd.DataFrame({"Name": ["a"], "Owner": ["b"]}))
+        result = self.indexer.process_rfp_responses(path)
+        self.assertFalse(result["success"])
+        self.assertEqual(result["available_columns"], ["Name", "Owner"])
+
+    def test_closes_the_workbook_when_a_row_fails(self):
+        path = self.write_xlsx(pd.DataFrame({"Requirement": ["Describe security"], "Response": ["Encrypted"]}))
+        closed = []
+        load_workbook = rfp_response_indexer.openpyxl.load_workbook
+
+        def tracking_load_workbook(*args, **kwargs):
+            workbook = load_workbook(*args, **kwargs)
+            close = workbook.close
+            workbook.close = lambda: (closed.append(True), close())
+            return workbook
+
+        with mock.patch.object(rfp_response_indexer.openpyxl, "load_workbook", tracking_load_workbook), \
+                mock.patch.object(rfp_response_indexer, "_cell_text", side_effect=RuntimeError("bad cell")):
+            result = self.indexer.process_rfp_responses(path)
+        self.assertFalse(result["success"])
+        self.assertEqual(closed, [True])
+
+class TestAddToVectorStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.tmp_dir.name, "store")
+        self.indexer = RFPResponseIndexer(self.store_path)
+        patcher = mock.patch.object(rfp_response_indexer, "embed_texts", side_effect=fake_embed_texts)
+        self.embed_texts = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_skips_documents_repeated_in_a_batch(self):
+        result = self.indexer.add_to_vector_store(["doc a", "doc b", "doc a"])
+        self.assertTrue(result["success"])
+        self.assertEqual((result["documents_added"], result["duplicates_skipped"]), (2, 1))
+        self.assertEqual(result["document_ids"], [0, 1, 0])
+        self.assertEqual(self.embed_texts.call_args[0][0], ["doc a", "doc b"])
+
+    def test_skips_documents_already_in_the_store(self):
+        self.indexer.add_to_vector_store(["doc a", "doc b"])
+        result = self.indexer.add_to_vector_store(["doc b", "doc c", "doc c"])
+
+        self.assertEqual((result["documents_added"], result["duplicates_skipped"]), (1, 2))
+        self.assertEqual(result["document_ids"], [1, 2, 2])
+        self.assertEqual((result["initial_document_count"], result["final_document_count"]), (2, 3))
+        self.assertEqual(self.embed_texts.call_args[0][0], ["doc c"])
+        self.assertEqual(FAISSStore.load(self.store_path).document_map, {0: "doc a", 1: "doc b", 2: "doc c"})
+
+    def test_all_duplicates_leave_the_store_untouched(self):
+        self.indexer.add_to_vector_store(["doc a"])
+        self.embed_texts.reset_mock()
+        result = self.indexer.add_to_vector_store(["doc a", "doc a"])
+
+        self.assertEqual((result["documents_added"], result["document_ids"]), (0, [0, 0]))
+        self.embed_texts.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
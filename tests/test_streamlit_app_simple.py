@@ -0,0 +1,32 @@
+import unittest
+from src.app.streamlit_app_simple import fan_out_answers, normalize_requirement, unique_requirements
+
+class TestRequirementFanOut(unittest.TestCase):
+
+    def test_normalize_requirement_ignores_case_spacing_and_trailing_punctuation(self):
+        self.assertEqual(normalize_requirement("  Describe   your\tSLA? "), "describe your sla")
+        self.assertEqual(normalize_requirement("Describe your SLA."), normalize_requirement("describe your sla"))
+        self.assertNotEqual(normalize_requirement("Describe your SLA"), normalize_requirement("Describe your SLAs"))
+
+    def test_unique_requirements_keep_first_seen_order_and_spelling(self):
+        requirements = ["Describe your SLA?", "List certifications", "describe  your sla", "Describe your SLA."]
+        self.assertEqual(list(unique_requirements(requirements).values()), ["Describe your SLA?", "List certifications"])
+
+    def test_answers_fan_out_to_every_requirement_in_order(self):
+        requirements = ["List certifications", "Describe your SLA?", "list certifications.", "DESCRIBE YOUR SLA"]
+        unique = unique_requirements(requirements)
+        answers = [{"answer": f"answer to {requirement}"} for requirement in unique.values()]
+
+        results = fan_out_answers(requirements, unique, answers)
+
+        self.assertEqual([result["requirement"] for result in results], requirements)
+        self.assertEqual([result["response"] for result in results], [
+            "answer to List certifications",
+            "answer to Describe your SLA?",
+            "answer to List certifications",
+            "answer to Describe your SLA?",
+        ])
+        self.assertTrue(all(result["status"] == "success" for result in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import io
+import unittest
+from unittest import mock
+import numpy as np
+import openpyxl
+import pandas as pd
+from src.app import ui_components
+from src.app.ui_components import STREAMING_EXCEL_MIN_ROWS
+
+def sheet_values(data):
+    worksheet = openpyxl.load_workbook(io.BytesIO(data)).active
+    return [list(row) for row in worksheet.iter_rows(values_only=True)]
+
+def sample_frame(rows):
+    cells = [[1, 2], np.array([1, 2]), np.nan, None, "text", 3]
+    return pd.DataFrame({
+        "ID": range(rows),
+        "Value": [cells[i % len(cells)] for i in range(rows)]
+    })
+
+class TestDataframeToExcelBytes(unittest.TestCase):
+
+    def excel_values(self, df):
+        # Bypass the Streamlit cache so every call goes through the writer
+        return sheet_values(ui_components.dataframe_to_excel_bytes.__wrapped__(df))
+
+    def test_streaming_writers_match_the_pandas_writer(self):
+        small = self.excel_values(sample_frame(STREAMING_EXCEL_MIN_ROWS - 1))
+        large = sample_frame(STREAMING_EXCEL_MIN_ROWS + 20)
+        with_xlsxwriter = self.excel_values(large)
+        with mock.patch.object(ui_components, "xlsxwriter", None):
+            with_openpyxl = self.excel_values(large)
+
+        self.assertEqual(small[0], ["ID", "Value"])
+        self.assertEqual(small[1:7], [[0, "[1, 2]"], [1, "[1 2]"], [2, None], [3, None], [4, "text"], [5, 3]])
+        self.assertEqual(with_xlsxwriter[:len(small)], small)
+        self.assertEqual(with_openpyxl, with_xlsxwriter)
+        self.assertEqual(len(with_xlsxwriter), STREAMING_EXCEL_MIN_ROWS + 21)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import pickle
+import unittest
+import tempfile
+import faiss
+import numpy as np
+from src.vector_store.vector_store import FAISSStore, HNSW_MIN_VECTORS, INDEX_FILE, PICKLE_DOCSTORE_FILE
+
+class TestFAISSStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = FAISSStore(dimension=3)
+        self.store.add_texts(
+            ["first document", "second document", "third document"],
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        )
+
+    def test_similarity_search_batch_matches_single_search(self):
+        queries = np.array([[1.0, 0.1, 0.1], [0.1, 0.1, 1.0]], dtype=np.float32)
+        batch_results = self.store.similarity_search_batch(queries, k=2)
+
+        self.assertEqual(len(batch_results), 2)
+        for query, results in zip(queries, batch_results):
+            self.assertEqual(results, self.store.similarity_search(query.tolist(), k=2))
+        self.assertEqual(batch_results[0][0][1], "first document")
+        self.assertEqual(batch_results[1][0][1], "third document")
+
+    def test_search_restores_openmp_thread_count(self):
+        previous = faiss.omp_get_max_threads()
+        faiss.omp_set_num_threads(3)
+        try:
+            self.store.similarity_search([1.0, 0.0, 0.0], k=1)
+            self.store.similarity_search_batch(np.eye(3, dtype=np.float32), k=1)
+            self.assertEqual(faiss.omp_get_max_threads(), 3)
+        finally:
+            faiss.omp_set_num_threads(previous)
+
+    def test_load_with_mmap_returns_same_results(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            self.store.save(store_dir)
+            loaded = FAISSStore.load(store_dir, mmap=True)
+
+            if os.path.exists("/proc/self/maps"):
+                with open("/proc/self/maps") as maps:
+                    self.assertIn(os.path.join(store_dir, INDEX_FILE), maps.read())
+            self.assertEqual(loaded.dimension, 3)
+            self.assertEqual(loaded.document_map, self.store.document_map)
+            self.assertEqual(
+                loaded.similarity_search([0.0, 1.0, 0.1], k=3),
+                self.store.similarity_search([0.0, 1.0, 0.1], k=3)
+            )
+            with self.assertRaises(ValueError):
+                loaded.add_texts(["fourth document"], [[1.0, 1.0, 0.0]])
+            with self.assertRaises(ValueError):
+                loaded.save(store_dir)
+
+    def test_save_replaces_files_under_a_mapped_store(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            self.store.save(store_dir)
+            loaded = FAISSStore.load(store_dir, mmap=True)
+            expected = loaded.similarity_search([1.0, 0.0, 0.0], k=3)
+
+            self.store.add_texts(["fourth document"], [[1.0, 1.0, 0.0]])
+            self.store.save(store_dir)
+
+            # The mapped store still searches its own copy; a fresh load sees the new one
+            self.assertEqual(loaded.similarity_search([1.0, 0.0, 0.0], k=3), expected)
+            self.assertEqual(FAISSStore.load(store_dir).index.ntotal, 4)
+            self.assertFalse([name for name in os.listdir(store_dir) if name.endswith(".tmp")])
+
+    def test_load_reads_pickled_docstore(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            faiss.write_index(self.store.index, os.path.join(store_dir, INDEX_FILE))
+            with open(os.path.join(store_dir, PICKLE_DOCSTORE_FILE), "wb") as f:
+                pickle.dump({"document_map": self.store.document_map, "current_id": 3}, f)
+            self.assertTrue(FAISSStore.exists(store_dir))
+
+            loaded = FAISSStore.load(store_dir)
+            self.assertEqual(loaded.document_map, self.store.document_map)
+            self.assertEqual(loaded.current_id, 3)
+
+            # Saving again replaces the pickle with the columnar docstore when pyarrow is available
+            loaded.save(store_dir)
+            self.assertEqual(FAISSStore.load(store_dir).document_map, self.store.document_map)
+
+    def test_add_texts_accepts_embedding_matrix(self):
+        embeddings = np.array([[1.0, 1.0, 0.0], [0.0, 1.0, 1.0]], dtype=np.float32)
+        doc_ids = self.store.add_texts(["fourth document", "fifth document"], embeddings)
+
+        self.assertEqual(doc_ids, [3, 4])
+        self.assertEqual(self.store.index.ntotal, 5)
+        self.assertEqual(self.store.similarity_search([0.0, 1.0, 1.0], k=1)[0][1], "fifth document")
+        self.assertEqual(self.store.add_texts([], np.empty((0, 3), dtype=np.float32)), [])
+
+    def test_large_store_switches_to_hnsw(self):
+        store = FAISSStore(dimension=8)
+        embeddings = np.random.default_rng(0).random((HNSW_MIN_VECTORS, 8), dtype=np.float32)
+        store.add_texts([f"document {i}" for i in range(10)], embeddings[:10])
+        self.assertIsInstance(store.index, faiss.IndexFlat)
+
+        store.add_texts([f"document {i}" for i in range(10, HNSW_MIN_VECTORS)], embeddings[10:])
+
+        self.assertIsInstance(store.index, faiss.IndexHNSWFlat)
+        self.assertEqual(store.index.ntotal, HNSW_MIN_VECTORS)
+        for i in (3, 500):
+            doc_id, text, score = store.similarity_search(embeddings[i].tolist(), k=1)[0]
+            self.assertEqual((doc_id, text), (i, f"document {i}"))
+            self.assertAlmostEqual(score, 1.0, places=5)
+
+    def test_scores_are_cosine_similarity(self):
+        results = self.store.similarity_search([2.0, 2.0, 0.0], k=3)
+
+        self.assertAlmostEqual(results[0][2], np.sqrt(0.5), places=5)
+        self.assertAlmostEqual(results[2][2], 0.0, places=5)
+        self.assertEqual(self.store.cosine_similarity(results[0][2]), results[0][2])
+
+        # Stores saved with an L2 index report squared distances between unit vectors
+        self.store.index = faiss.IndexFlatL2(3)
+        self.assertAlmostEqual(self.store.cosine_similarity(0.5), 0.75)
+
+if __name__ == '__main__':
+    unittest.main()